@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the CrewAI pipeline against the fake LLM server.
+
+Starts benchmarks/fake_llm_server.py in-process, points the crew at it
+(SLIDES_LLM_BASE_URL) with a throwaway LLM cache (SLIDES_LLM_CACHE_PATH),
+and times build_crew, crew.kickoff and extract_slides_json over several
+runs. Model time is simulated by the server, so "overhead" (kickoff wall
+time minus simulated model time) is what the pipeline itself costs - the
+number to watch for regressions.
+
+Usage: python benchmarks/bench_crew.py [--service-date 2025-10-12] [--runs 3]
+                                       [--latency 0.2] [--tokens-per-sec 50]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_llm_server import start_server, DEFAULT_RECORDINGS
+
+
+def slides_from_result(result, extract_slides_json):
+    """Slides from the last task output that holds a JSON slide list"""
+    outputs = list(getattr(result, "tasks_output", None) or [result])
+    for output in reversed(outputs):
+        try:
+            return extract_slides_json(output)
+        except Exception:
+            continue
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the crew pipeline with a stand-in LLM")
+    parser.add_argument("--service-date", default="2025-10-12")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--recordings", default=DEFAULT_RECORDINGS)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per request")
+    parser.add_argument("--tokens-per-sec", type=float, default=0.0,
+                        help="Simulated generation speed (0 = instant)")
+    args = parser.parse_args()
+
+    server, fake, base_url = start_server(args.recordings, 0, args.latency, args.tokens_per_sec)
+    # Must be set before service_crew is imported. The fake answers go to
+    # a throwaway cache, never output/llm_cache.sqlite
+    cache_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+    os.environ["SLIDES_LLM_BASE_URL"] = base_url
+    os.environ["SLIDES_LLM_CACHE_PATH"] = os.path.join(cache_dir.name, "llm_cache.sqlite")
+    os.chdir(REPO_ROOT)
+
+    start = time.perf_counter()
+    from src.main import load_service_order, extract_slides_json
+    from src.service_crew import build_crew
+    import_time = time.perf_counter() - start
+
+    service_data = load_service_order(args.service_date)
+    theme = service_data.get("theme", "default")
+
+    timings = {"build_crew": [], "kickoff": [], "model (simulated)": [],
+               "overhead": [], "extract_slides_json": []}
+    requests = 0
+    slide_count = 0
+    for run in range(args.runs):
+        start = time.perf_counter()
+        crew, theme_backgrounds_path, _ = build_crew(
+            "backgrounds", "output", theme, args.service_date, use_cache=False)
+        timings["build_crew"].append(time.perf_counter() - start)
+
+        model_before, requests_before = fake.model_time, fake.requests
+        start = time.perf_counter()
+        result = crew.kickoff(inputs={
+            "service_date": args.service_date,
+            "service_data": service_data,
+            "backgrounds_path": theme_backgrounds_path,
+            "output_dir": "output",
+        })
+        kickoff = time.perf_counter() - start
+        model = fake.model_time - model_before
+        timings["kickoff"].append(kickoff)
+        timings["model (simulated)"].append(model)
+        timings["overhead"].append(kickoff - model)
+        requests = fake.requests - requests_before
+
+        start = time.perf_counter()
+        slide_count = len(slides_from_result(result, extract_slides_json))
+        timings["extract_slides_json"].append(time.perf_counter() - start)
+
+    server.shutdown()
+    cache_dir.cleanup()
+
+    print(f"\n📊 Crew pipeline, {args.runs} run(s), {requests} LLM request(s)/run, {slide_count} slides")
+    print(f"   latency {args.latency}s, {args.tokens_per_sec or '∞'} tokens/s, imports {import_time:.2f}s\n")
+    print(f"  {'stage':<22}{'median':>10}{'min':>10}")
+    for stage, values in timings.items():
+        print(f"  {stage:<22}{statistics.median(values) * 1000:>8.1f}ms{min(values) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-row draw.line gradient vs. the shared vertical_gradient.
+
+Usage: python benchmarks/bench_gradient.py [--repeat 5]
+"""
+
+import os
+import sys
+import timeit
+import argparse
+from PIL import Image, ImageDraw, ImageChops
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tools.image_utils import vertical_gradient
+
+COLOR_TOP = (0, 120, 200)
+COLOR_BOTTOM = (0, 60, 130)
+
+# vertical_gradient uses an 8-bit mask, so rows may be a few levels off
+MAX_CHANNEL_DIFF = 3
+
+SIZES = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+}
+
+
+def line_loop_gradient(width, height, color_top, color_bottom):
+    """The original implementation: one draw.line call per row"""
+    img = Image.new("RGB", (width, height), color_top)
+    draw = ImageDraw.Draw(img)
+    for i in range(height):
+        ratio = i / height
+        r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
+        g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
+        b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
+        draw.line([(0, i), (width, i)], fill=(r, g, b))
+    return img
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gradient generation")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'size':<8}{'draw.line':>14}{'vertical_gradient':>20}{'speedup':>10}")
+    for label, (width, height) in SIZES.items():
+        legacy = line_loop_gradient(width, height, COLOR_TOP, COLOR_BOTTOM)
+        shared = vertical_gradient(width, height, COLOR_TOP, COLOR_BOTTOM)
+        worst = max(high for _, high in ImageChops.difference(legacy, shared).getextrema())
+        if worst > MAX_CHANNEL_DIFF:
+            print(f"❌ {label}: gradients differ by up to {worst} levels")
+            sys.exit(1)
+
+        old = min(timeit.repeat(
+            lambda: line_loop_gradient(width, height, COLOR_TOP, COLOR_BOTTOM),
+            number=1, repeat=args.repeat))
+        new = min(timeit.repeat(
+            lambda: vertical_gradient(width, height, COLOR_TOP, COLOR_BOTTOM),
+            number=1, repeat=args.repeat))
+        print(f"{label:<8}{old * 1000:>12.2f}ms{new * 1000:>18.2f}ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the direct (non-AI) conversion path.
+
+Runs `import simple_convert` in fresh interpreters and reports the
+wall-clock cost, the slowest modules from `python -X importtime`, and
+whether any agent-framework packages were pulled in.
+
+Usage: python benchmarks/bench_imports.py [--module simple_convert] [--repeat 5]
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages the direct path should never need
+HEAVY_PACKAGES = ("crewai", "litellm", "langchain", "openai")
+
+CHECK_SNIPPET = (
+    "import sys, {module}; "
+    "print(','.join(sorted({{m.split('.')[0] for m in sys.modules}} & set({heavy!r}))))"
+)
+
+
+def time_import(module, repeat):
+    """Best-of-N wall time (seconds) to start Python and import module"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"],
+                       cwd=REPO_ROOT, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def slowest_imports(module, count=10):
+    """Top modules by cumulative import time, from -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import time of the direct conversion path")
+    parser.add_argument("--module", default="simple_convert", help="Module to import")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to time")
+    args = parser.parse_args()
+
+    baseline = time_import("os", args.repeat)
+    total = time_import(args.module, args.repeat)
+    print(f"⏱️  python -c 'import {args.module}': {total * 1000:.0f} ms "
+          f"({(total - baseline) * 1000:.0f} ms over a bare interpreter)")
+
+    print("\nSlowest imports (cumulative):")
+    for cumulative_us, name in slowest_imports(args.module):
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    check = subprocess.run(
+        [sys.executable, "-c", CHECK_SNIPPET.format(module=args.module, heavy=HEAVY_PACKAGES)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    loaded = check.stdout.strip()
+    if loaded:
+        print(f"\n❌ Agent-framework packages imported: {loaded}")
+        sys.exit(1)
+    print("\n✅ No agent-framework packages imported")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Throughput and accuracy benchmark for the service order parser.
+
+Generates a corpus of synthetic bulletins (seeded, so every run sees the
+same documents) whose true items are known by construction, then times
+src/tools/service_parser.py on the plain text and, through
+word_to_yaml.read_docx, on the same bulletins written as .docx files with
+bold headers. Accuracy is reported as title precision/recall, slide type
+accuracy, and the share of bulletins parsed exactly right.
+
+Usage: python benchmarks/bench_parser.py [--bulletins 200] [--seed 7] [--runs 3]
+                                         [--no-docx] [--write corpus_dir]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import zipfile
+import argparse
+import tempfile
+import statistics
+from xml.sax.saxutils import escape
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from src.tools.service_parser import iter_service_items, identify_slide_type
+
+# (title, slide type, content lines) the generator picks items from.
+# Titles without a known header word are only recognisable from what
+# follows them (or, in .docx, from being bold) - the hard cases.
+ITEM_TEMPLATES = [
+    ("5 Minute Countdown", "countdown", []),
+    ("Opening Praise:", "song", ["{song}"]),
+    ("Announcements", "text", []),
+    ("Children's Message", "children_message", ["-{person}"]),
+    ("Call to Worship", "liturgy", ["L: {line}", "P: {line}", "L: {line}", "P: {line}"]),
+    ("Opening Prayer:", "prayer", ["{paragraph}"]),
+    ("Hymn of Praise:", "hymn", ["#{number} {song}"]),
+    ("Scripture: {reference}", "scripture", ["{paragraph}"]),
+    ("Sermon:", "sermon", ["-{person}"]),
+    ("Holy Communion", "communion", []),
+    ("Lord's Prayer", "prayer", []),
+    ("Prayers for the Community", "prayer", []),
+    ("Offering with Doxology", "offering", []),
+    ("Responsive Reading", "scripture", ["L: {line}", "P: {line}"]),
+    ("Closing Praise:", "song", ["{song}"]),
+    ("Special Music", "text", ["-{person}"]),
+    ("Baptism", "text", ["{paragraph}"]),
+    ("Welcome", "text", []),
+    ("Dismissal", "dismissal", []),
+]
+
+SONGS = ["And All The People Said Amen", "My Lighthouse", "Take My Life and Let it Be",
+         "Great Is Thy Faithfulness", "Build My Life", "Way Maker", "Goodness of God"]
+PEOPLE = ["Pastor Megan", "Pastor John", "Elder Ruth", "The Youth Choir", "Deacon Sam"]
+BOOKS = ["Acts", "John", "Psalm", "Romans", "Luke", "Isaiah", "Genesis"]
+WORDS = ("grace light mercy faith hope love peace river shore boat storm calm "
+         "disciples called gathered sent water bread table song heart voice").split()
+THEMES = ["Disciples Making Disciples", "On The Water", "Light in Darkness", "Bread for the Journey"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+
+def _sentence(rng, words):
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _fill(template, rng):
+    return template.format(
+        song=rng.choice(SONGS),
+        person=rng.choice(PEOPLE),
+        number=rng.randint(1, 800),
+        reference=f"{rng.choice(BOOKS)} {rng.randint(1, 28)}:{rng.randint(1, 20)}-{rng.randint(21, 40)}",
+        line=_sentence(rng, rng.randint(5, 10)),
+        paragraph=" ".join(_sentence(rng, rng.randint(8, 16)) for _ in range(rng.randint(2, 6))),
+    )
+
+
+def make_bulletin(rng):
+    """One synthetic bulletin: (lines as [(text, is_header)], expected items)"""
+    month = rng.randrange(12)
+    lines = [
+        (f"Service Date: {MONTHS[month]} {rng.randint(1, 28)}, {rng.randint(2024, 2027)}", False),
+        (f"Theme:  {rng.choice(THEMES)}", False),
+        (f"Speaker: {rng.choice(PEOPLE)}", False),
+        ("~" * 44, False),
+        ("Order of Service", False),
+    ]
+    middle = rng.sample(ITEM_TEMPLATES[1:-1], rng.randint(6, len(ITEM_TEMPLATES) - 2))
+    expected = []
+    for title, slide_type, content in [ITEM_TEMPLATES[0]] + middle + [ITEM_TEMPLATES[-1]]:
+        title = _fill(title, rng)
+        body = [_fill(line, rng) for line in content]
+        lines.append((title, True))
+        lines.extend((line, False) for line in body)
+        if rng.random() < 0.3:
+            lines.append(("", False))
+        presenter = [line[1:] for line in body if line.startswith("-")]
+        expected.append({
+            "title": title.rstrip(":").strip(),
+            "type": slide_type,
+            "presenter": presenter[0] if presenter else None,
+        })
+    return lines, expected
+
+
+def make_corpus(count, seed):
+    rng = random.Random(seed)
+    return [make_bulletin(rng) for _ in range(count)]
+
+
+def write_docx(path, lines):
+    """Minimal .docx with one paragraph per line, headers in bold"""
+    paragraphs = []
+    for text, is_header in lines:
+        run_properties = "<w:rPr><w:b/></w:rPr>" if is_header else ""
+        paragraphs.append(f'<w:p><w:r>{run_properties}<w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>')
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{"".join(paragraphs)}</w:body></w:document>')
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml",
+                      '<?xml version="1.0" encoding="UTF-8"?>'
+                      '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                      '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                      '<Default Extension="xml" ContentType="application/xml"/>'
+                      '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                      '</Types>')
+        docx.writestr("_rels/.rels",
+                      '<?xml version="1.0" encoding="UTF-8"?>'
+                      '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                      '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+                      '</Relationships>')
+        docx.writestr("word/document.xml", document)
+
+
+def score(parsed, expected, totals):
+    """Add one bulletin's results to the running totals"""
+    parsed_titles = [item["title"] for item in parsed]
+    expected_titles = [item["title"] for item in expected]
+    matched = set(parsed_titles) & set(expected_titles)
+    totals["parsed"] += len(parsed_titles)
+    totals["expected"] += len(expected_titles)
+    totals["matched"] += len(matched)
+
+    by_title = {item["title"]: item for item in parsed}
+    for item in expected:
+        found = by_title.get(item["title"])
+        if found is not None:
+            totals["typed"] += identify_slide_type(found["title"], found["content"]) == item["type"]
+    exact = parsed_titles == expected_titles and all(
+        by_title[item["title"]]["metadata"].get("presenter") == item["presenter"] for item in expected)
+    totals["exact"] += exact
+    totals["bulletins"] += 1
+
+
+def run_pass(name, corpus, parse, runs):
+    """Time parse(bulletin index) over the corpus; returns the stats row"""
+    times = []
+    totals = None
+    for _ in range(runs):
+        totals = dict.fromkeys(("parsed", "expected", "matched", "typed", "exact", "bulletins"), 0)
+        start = time.perf_counter()
+        results = [parse(index) for index in range(len(corpus))]
+        times.append(time.perf_counter() - start)
+        for parsed, (_, expected) in zip(results, corpus):
+            score(parsed, expected, totals)
+    best = min(times)
+    return {
+        "input": name,
+        "bulletins_per_s": len(corpus) / best if best else float("inf"),
+        "median_ms": statistics.median(times) * 1000,
+        "precision": totals["matched"] / totals["parsed"] if totals["parsed"] else 0.0,
+        "recall": totals["matched"] / totals["expected"] if totals["expected"] else 0.0,
+        "type_accuracy": totals["typed"] / totals["matched"] if totals["matched"] else 0.0,
+        "exact": totals["exact"] / totals["bulletins"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the service order parser on synthetic bulletins")
+    parser.add_argument("--bulletins", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--no-docx", action="store_true", help="Skip the Word document pass")
+    parser.add_argument("--write", metavar="DIR",
+                        help="Also save the corpus (.txt, .docx and expected .json) to DIR")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.bulletins, args.seed)
+    texts = ["\n".join(text for text, _ in lines) for lines, _ in corpus]
+    total_lines = sum(len(lines) for lines, _ in corpus)
+
+    rows = [run_pass("text", corpus, lambda index: list(iter_service_items(texts[index].split("\n"))),
+                     args.runs)]
+
+    corpus_dir = args.write
+    temporary = None
+    if corpus_dir is None and not args.no_docx:
+        temporary = tempfile.TemporaryDirectory()
+        corpus_dir = temporary.name
+    if corpus_dir:
+        os.makedirs(corpus_dir, exist_ok=True)
+        for index, (lines, expected) in enumerate(corpus):
+            stem = os.path.join(corpus_dir, f"bulletin_{index:04d}")
+            write_docx(stem + ".docx", lines)
+            if args.write:
+                with open(stem + ".txt", "w", encoding="utf-8") as f:
+                    f.write(texts[index] + "\n")
+                with open(stem + ".json", "w", encoding="utf-8") as f:
+                    json.dump(expected, f, indent=2)
+
+    if not args.no_docx:
+        from word_to_yaml import read_docx
+
+        def parse_docx(index):
+            text, header_hints = read_docx(os.path.join(corpus_dir, f"bulletin_{index:04d}.docx"))
+            return list(iter_service_items(text.split("\n"), header_hints))
+
+        rows.append(run_pass("docx", corpus, parse_docx, args.runs))
+
+    if temporary is not None:
+        temporary.cleanup()
+
+    print(f"\n📊 Parser, {args.bulletins} synthetic bulletins ({total_lines} lines, seed {args.seed}), "
+          f"best of {args.runs}\n")
+    print(f"  {'input':<8}{'bulletins/s':>13}{'median':>11}{'precision':>11}{'recall':>9}{'types':>8}{'exact':>8}")
+    for row in rows:
+        print(f"  {row['input']:<8}{row['bulletins_per_s']:>13.0f}{row['median_ms']:>9.1f}ms"
+              f"{row['precision']:>10.1%}{row['recall']:>9.1%}{row['type_accuracy']:>8.1%}{row['exact']:>8.1%}")
+    if args.write:
+        print(f"\n📁 Corpus written to {args.write}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Stand-in LLM server for running the crew pipeline without Ollama.
+
+Speaks enough of the Ollama API (/api/generate, /api/chat) and the
+OpenAI API (/v1/chat/completions) for litellm, and answers every request
+with a recorded response picked by matching text in the prompt (e.g. the
+agent role). A fixed latency and a token rate simulate model speed, so
+benchmarks measure pipeline overhead independently of the real model.
+
+Usage:
+    python benchmarks/fake_llm_server.py --port 11500 --latency 0.5 --tokens-per-sec 40
+    SLIDES_LLM_BASE_URL=http://127.0.0.1:11500 python -m src.main --service-date 2025-10-12
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_RECORDINGS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "recordings", "crew_2025-10-12.json")
+
+# Rough token size used for the simulated generation time and usage counts
+CHARS_PER_TOKEN = 4
+
+
+def load_recordings(path):
+    """Recordings file: {"responses": [{"match": "...", "response": "..."}], "default": "..."}"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def count_tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class FakeLLM:
+    """Picks recorded responses and tracks the simulated model time"""
+
+    def __init__(self, recordings, latency=0.0, tokens_per_sec=0.0):
+        self.responses = recordings.get("responses", [])
+        self.default = recordings.get("default", "Final Answer: []")
+        self.latency = latency
+        self.tokens_per_sec = tokens_per_sec
+        self.requests = 0
+        self.model_time = 0.0
+        self._lock = threading.Lock()
+
+    def respond(self, prompt):
+        """Return (text, prompt_tokens, completion_tokens) after the simulated delay"""
+        text = self.default
+        for recording in self.responses:
+            if recording["match"] in prompt:
+                text = recording["response"]
+                break
+
+        completion_tokens = count_tokens(text)
+        delay = self.latency
+        if self.tokens_per_sec > 0:
+            delay += completion_tokens / self.tokens_per_sec
+        time.sleep(delay)
+
+        with self._lock:
+            self.requests += 1
+            self.model_time += delay
+        return text, count_tokens(prompt), completion_tokens
+
+
+def _prompt_text(body):
+    """Flatten an Ollama or OpenAI request body to the text we match on"""
+    if "prompt" in body:
+        return str(body.get("system", "")) + "\n" + str(body["prompt"])
+    parts = []
+    for message in body.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        parts.append(str(content))
+    return "\n".join(parts)
+
+
+def make_handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            # Ollama model listing, used by some clients as a health check
+            self._send_json({"models": [{"name": "fake", "model": "fake"}]})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            text, prompt_tokens, completion_tokens = fake.respond(_prompt_text(body))
+            model = body.get("model", "fake")
+            now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+            if self.path.startswith("/api/generate"):
+                self._send_json({
+                    "model": model, "created_at": now, "response": text, "done": True,
+                    "prompt_eval_count": prompt_tokens, "eval_count": completion_tokens,
+                })
+            elif self.path.startswith("/api/chat"):
+                self._send_json({
+                    "model": model, "created_at": now, "done": True,
+                    "message": {"role": "assistant", "content": text},
+                    "prompt_eval_count": prompt_tokens, "eval_count": completion_tokens,
+                })
+            else:
+                self._send_json({
+                    "id": f"fake-{fake.requests}", "object": "chat.completion",
+                    "created": int(time.time()), "model": model,
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": text}}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                              "total_tokens": prompt_tokens + completion_tokens},
+                })
+
+    return Handler
+
+
+def start_server(recordings_path=DEFAULT_RECORDINGS, port=0, latency=0.0, tokens_per_sec=0.0):
+    """Start the server on a background thread; returns (server, fake, base_url)"""
+    fake = FakeLLM(load_recordings(recordings_path), latency, tokens_per_sec)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(fake))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, fake, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded LLM responses over HTTP")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--recordings", default=DEFAULT_RECORDINGS)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each response")
+    parser.add_argument("--tokens-per-sec", type=float, default=0.0,
+                        help="Simulated generation speed (0 = instant)")
+    args = parser.parse_args()
+
+    server, _, base_url = start_server(args.recordings, args.port, args.latency, args.tokens_per_sec)
+    print(f"🤖 Fake LLM listening on {base_url} (Ctrl+C to stop)")
+    print(f"   export SLIDES_LLM_BASE_URL={base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,16 @@ Usage:
 import os
 import sys
 import argparse
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, GifImagePlugin
 import subprocess
 import shutil
+import tempfile
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.tools.image_utils import vertical_gradient
 
 # Import cross-platform utilities
 try:
@@ -77,116 +84,329 @@ def load_font(size):
     print(f"⚠️ Using default font (Arial not found on {sys.platform})")
     return ImageFont.load_default()
 
+TIMER_GLYPHS = "0123456789:"
+
+class GlyphAtlas:
+    """Timer glyphs rasterised once for a given font, size and color.
+    
+    Each digit and the colon is rendered to a coverage mask a single time.
+    A "MM:SS" string is then assembled by pasting the shadow and text ink
+    through those masks, so FreeType is not touched per frame.
+    """
+    
+    def __init__(self, font, text_color=(255, 255, 255),
+                 shadow_color=(0, 0, 0, 180), shadow_offset=4):
+        self.text_ink = text_color + (255,)
+        self.shadow_ink = shadow_color
+        self.shadow_offset = shadow_offset
+        self.masks = {}
+        self.advances = {}
+        self.bboxes = {}
+        
+        pad = 16
+        for ch in TIMER_GLYPHS:
+            bbox = font.getbbox(ch)
+            mask = Image.new("L", (bbox[2] + pad * 2, bbox[3] + pad * 2), 0)
+            ImageDraw.Draw(mask).text((pad, pad), ch, fill=255, font=font)
+            # Crop to the glyph box; masks are positioned relative to the origin
+            self.masks[ch] = mask.crop((bbox[0] + pad, bbox[1] + pad, bbox[2] + pad, bbox[3] + pad))
+            self.bboxes[ch] = bbox
+            self.advances[ch] = font.getlength(ch)
+    
+    def layout(self, text):
+        """Return [(char, x)] glyph origins and the text bbox, like textbbox"""
+        glyphs = []
+        x = 0.0
+        for ch in text:
+            glyphs.append((ch, int(x)))
+            x += self.advances[ch]
+        left = min(gx + self.bboxes[ch][0] for ch, gx in glyphs)
+        top = min(self.bboxes[ch][1] for ch, _ in glyphs)
+        right = max(gx + self.bboxes[ch][2] for ch, gx in glyphs)
+        bottom = max(self.bboxes[ch][3] for ch, _ in glyphs)
+        return glyphs, (left, top, right, bottom)
+    
+    def draw(self, image, xy, text):
+        """Draw text (with shadow) onto image at xy, like draw.text"""
+        glyphs, _ = self.layout(text)
+        x, y = xy
+        for ink, offset in ((self.shadow_ink, self.shadow_offset), (self.text_ink, 0)):
+            for ch, gx in glyphs:
+                bbox = self.bboxes[ch]
+                image.paste(ink, (x + gx + bbox[0] + offset, y + bbox[1] + offset), self.masks[ch])
+
+_glyph_atlas_cache = {}
+
+def get_glyph_atlas(font, text_color=(255, 255, 255)):
+    """Return the cached GlyphAtlas for this font, size and color"""
+    key = (getattr(font, 'path', None) or id(font), getattr(font, 'size', None), tuple(text_color))
+    atlas = _glyph_atlas_cache.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, tuple(text_color))
+        _glyph_atlas_cache[key] = atlas
+    return atlas
+
+class CountdownRenderer:
+    """Render countdown frames from a cached static layer.
+    
+    The gradient, logo, church name, shadowed box and label never change
+    between frames, so they are drawn once when the renderer is created.
+    Each frame then only redraws the timer region on top of that layer.
+    
+    Frames are not pixel-identical to the old per-frame renderer: the box
+    is sized once for the largest timer string (the widest and tallest of
+    "00:00" .. "99:99") instead of each frame's own text, so it no longer
+    changes size as the digits change. The label and timer are placed from
+    the box top, so they can sit a few pixels off the old positions.
+    """
+    
+    def __init__(self, width=1920, height=1080,
+                 bg_color_top=(0, 120, 200), bg_color_bottom=(0, 60, 130),
+                 text_color=(255, 255, 255),
+                 church_name="Vernon United Methodist Church",
+                 logo_path=None):
+        self.width = width
+        self.height = height
+        
+        # Load fonts with cross-platform support
+        timer_font = load_font(200)
+        self.atlas = get_glyph_atlas(timer_font, text_color)
+        label_font = load_font(60)
+        church_font = load_font(72)
+        
+        # Create gradient background
+        img = vertical_gradient(width, height, bg_color_top, bg_color_bottom)
+        
+        # Convert to RGBA for transparency effects
+        img_rgba = img.convert("RGBA")
+        draw = ImageDraw.Draw(img_rgba)
+        
+        # --- Add Church Logo (top center) ---
+        logo_bottom_y = 80
+        if logo_path and os.path.exists(logo_path):
+            try:
+                logo = Image.open(logo_path)
+                logo_max_width = 250
+                logo_aspect = logo.height / logo.width
+                if logo.width > logo_max_width:
+                    logo = logo.resize((logo_max_width, int(logo_max_width * logo_aspect)), Image.Resampling.LANCZOS)
+                
+                if logo.mode != 'RGBA':
+                    logo = logo.convert('RGBA')
+                
+                logo_x = (width - logo.width) // 2
+                logo_y = 80
+                logo_bottom_y = logo_y + logo.height
+                
+                img_rgba.paste(logo, (logo_x, logo_y), logo)
+                draw = ImageDraw.Draw(img_rgba)
+                
+            except Exception as e:
+                print(f"   ⚠️ Could not load logo: {e}")
+        
+        # --- Draw Church Name ---
+        church_y = logo_bottom_y + 30
+        if church_name:
+            church_bbox = draw.textbbox((0, 0), church_name, font=church_font)
+            church_width = church_bbox[2] - church_bbox[0]
+            church_x = (width - church_width) // 2
+            
+            draw.text((church_x + 3, church_y + 3), church_name, fill=(0, 0, 0, 180), font=church_font)
+            draw.text((church_x, church_y), church_name, fill=text_color + (255,), font=church_font)
+        
+        # --- Draw countdown section ---
+        overlay = Image.new("RGBA", img_rgba.size, (0, 0, 0, 0))
+        overlay_draw = ImageDraw.Draw(overlay)
+        
+        # Size the box for the widest possible timer so it never moves
+        timer_bboxes = [
+            self.atlas.layout(f"{d}{d}:{d}{d}")[1]
+            for d in range(10)
+        ]
+        timer_width = max(bbox[2] - bbox[0] for bbox in timer_bboxes)
+        timer_height = max(bbox[3] - bbox[1] for bbox in timer_bboxes)
+        
+        label_text = "Service begins in"
+        label_bbox = draw.textbbox((0, 0), label_text, font=label_font)
+        label_width = label_bbox[2] - label_bbox[0]
+        
+        box_padding = 80
+        box_width = max(timer_width, label_width) + (box_padding * 2)
+        box_height = timer_height + 150
+        box_x = (width - box_width) // 2
+        box_y = (height - box_height) // 2
+        
+        overlay_draw.rounded_rectangle(
+            [(box_x, box_y), (box_x + box_width, box_y + box_height)],
+            radius=40,
+            fill=(0, 0, 0, 130)
+        )
+        
+        img_rgba = Image.alpha_composite(img_rgba, overlay)
+        draw = ImageDraw.Draw(img_rgba)
+        
+        # Draw label
+        label_x = (width - label_width) // 2
+        label_y = box_y + 30
+        draw.text((label_x + 3, label_y + 3), label_text, fill=(0, 0, 0, 180), font=label_font)
+        draw.text((label_x, label_y), label_text, fill=text_color + (255,), font=label_font)
+        
+        # Timer region: the strip of the box the digits (and shadow) can touch
+        self.timer_y = label_y + 80
+        region_top = self.timer_y + min(bbox[1] for bbox in timer_bboxes)
+        region_bottom = self.timer_y + max(bbox[3] for bbox in timer_bboxes) + 4
+        self.timer_region = (
+            max(box_x, 0), max(region_top, 0),
+            min(box_x + box_width + 1, width), min(region_bottom + 1, height)
+        )
+        
+        self.static_rgba = img_rgba
+        self.static_rgb = img_rgba.convert("RGB")
+        self.timer_background = img_rgba.crop(self.timer_region)
+    
+    def render_timer(self, minutes, seconds):
+        """Render just the timer region for the given time (RGB tile)"""
+        time_str = f"{minutes:02d}:{seconds:02d}"
+        
+        tile = self.timer_background.copy()
+        _, timer_bbox = self.atlas.layout(time_str)
+        timer_width = timer_bbox[2] - timer_bbox[0]
+        
+        # Draw timer from cached glyphs, offset into tile coordinates
+        timer_x = (self.width - timer_width) // 2 - self.timer_region[0]
+        timer_y = self.timer_y - self.timer_region[1]
+        self.atlas.draw(tile, (timer_x, timer_y), time_str)
+        
+        return tile.convert("RGB")
+    
+    def render(self, minutes, seconds):
+        """Render a full frame: a copy of the static layer plus the timer"""
+        frame = self.static_rgb.copy()
+        frame.paste(self.render_timer(minutes, seconds), self.timer_region[:2])
+        return frame
+
 def create_countdown_frame(minutes, seconds, width=1920, height=1080, 
                           bg_color_top=(0, 120, 200), bg_color_bottom=(0, 60, 130),
                           text_color=(255, 255, 255),
                           church_name="Vernon United Methodist Church",
                           logo_path=None):
-    """Create a single countdown frame with church branding"""
-    
-    # Create gradient background
-    img = Image.new("RGB", (width, height), bg_color_top)
-    draw = ImageDraw.Draw(img)
-    
-    # Draw gradient
-    for i in range(height):
-        ratio = i / height
-        r = int(bg_color_top[0] * (1 - ratio) + bg_color_bottom[0] * ratio)
-        g = int(bg_color_top[1] * (1 - ratio) + bg_color_bottom[1] * ratio)
-        b = int(bg_color_top[2] * (1 - ratio) + bg_color_bottom[2] * ratio)
-        draw.line([(0, i), (width, i)], fill=(r, g, b))
-    
-    # Load fonts with cross-platform support
-    timer_font = load_font(200)
-    label_font = load_font(60)
-    church_font = load_font(72)
-    
-    # Format time string
-    time_str = f"{minutes:02d}:{seconds:02d}"
-    
-    # Convert to RGBA for transparency effects
-    img_rgba = img.convert("RGBA")
-    draw = ImageDraw.Draw(img_rgba)
-    
-    # --- Add Church Logo (top center) ---
-    logo_bottom_y = 80
-    if logo_path and os.path.exists(logo_path):
+    """Create a single countdown frame with church branding
+    
+    Builds a throwaway renderer; use CountdownRenderer directly when
+    rendering more than one frame.
+    """
+    renderer = CountdownRenderer(
+        width, height,
+        bg_color_top=bg_color_top,
+        bg_color_bottom=bg_color_bottom,
+        text_color=text_color,
+        church_name=church_name,
+        logo_path=logo_path
+    )
+    return renderer.render(minutes, seconds)
+
+# Per-process renderer for parallel frame rendering
+_worker_renderer = None
+
+def _init_render_worker(renderer_kwargs):
+    """Process pool initializer: build the static layer once per worker"""
+    global _worker_renderer
+    _worker_renderer = CountdownRenderer(**renderer_kwargs)
+
+def _render_frame_bytes(remaining):
+    """Render one countdown second in a worker, as raw RGB bytes"""
+    return _worker_renderer.render(remaining // 60, remaining % 60).tobytes()
+
+def iter_countdown_frames(duration, renderer_kwargs, workers=1):
+    """Yield (remaining_seconds, raw RGB frame bytes) in countdown order.
+    
+    With workers > 1 the seconds are rendered across a process pool.
+    At most ``workers * 2`` frames are in flight, which bounds memory to a
+    small reorder buffer while still keeping every worker busy.
+    """
+    seconds = range(duration, -1, -1)
+    
+    if workers <= 1:
+        renderer = CountdownRenderer(**renderer_kwargs)
+        for remaining in seconds:
+            yield remaining, renderer.render(remaining // 60, remaining % 60).tobytes()
+        return
+    
+    window = workers * 2
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_render_worker,
+                             initargs=(renderer_kwargs,)) as pool:
+        pending = deque()
+        for remaining in seconds:
+            pending.append((remaining, pool.submit(_render_frame_bytes, remaining)))
+            if len(pending) >= window:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+
+def load_theme_colors(theme_path):
+    """Sample gradient colors from a theme's countdown background"""
+    bg_color_top = (0, 120, 200)
+    bg_color_bottom = (0, 60, 130)
+    
+    theme_path = normalize_path(theme_path)
+    if os.path.exists(theme_path):
         try:
-            logo = Image.open(logo_path)
-            logo_max_width = 250
-            logo_aspect = logo.height / logo.width
-            if logo.width > logo_max_width:
-                logo = logo.resize((logo_max_width, int(logo_max_width * logo_aspect)), Image.Resampling.LANCZOS)
-            
-            if logo.mode != 'RGBA':
-                logo = logo.convert('RGBA')
-            
-            logo_x = (width - logo.width) // 2
-            logo_y = 80
-            logo_bottom_y = logo_y + logo.height
-            
-            img_rgba.paste(logo, (logo_x, logo_y), logo)
-            draw = ImageDraw.Draw(img_rgba)
-            
-        except Exception as e:
-            print(f"   ⚠️ Could not load logo: {e}")
+            theme_img = Image.open(theme_path)
+            bg_color_top = theme_img.getpixel((theme_img.width // 2, 100))
+            bg_color_bottom = theme_img.getpixel((theme_img.width // 2, theme_img.height - 100))
+            print(f"🎨 Using theme colors from {theme_path}")
+        except:
+            print(f"⚠️ Could not load theme, using default colors")
     
-    # --- Draw Church Name ---
-    church_y = logo_bottom_y + 30
-    if church_name:
-        church_bbox = draw.textbbox((0, 0), church_name, font=church_font)
-        church_width = church_bbox[2] - church_bbox[0]
-        church_x = (width - church_width) // 2
-        
-        draw.text((church_x + 3, church_y + 3), church_name, fill=(0, 0, 0, 180), font=church_font)
-        draw.text((church_x, church_y), church_name, fill=text_color + (255,), font=church_font)
-    
-    # --- Draw countdown section ---
-    overlay = Image.new("RGBA", img_rgba.size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    
-    timer_bbox = draw.textbbox((0, 0), time_str, font=timer_font)
-    timer_width = timer_bbox[2] - timer_bbox[0]
-    timer_height = timer_bbox[3] - timer_bbox[1]
-    
-    label_text = "Service begins in"
-    label_bbox = draw.textbbox((0, 0), label_text, font=label_font)
-    label_width = label_bbox[2] - label_bbox[0]
-    
-    box_padding = 80
-    box_width = max(timer_width, label_width) + (box_padding * 2)
-    box_height = timer_height + 150
-    box_x = (width - box_width) // 2
-    box_y = (height - box_height) // 2
-    
-    overlay_draw.rounded_rectangle(
-        [(box_x, box_y), (box_x + box_width, box_y + box_height)],
-        radius=40,
-        fill=(0, 0, 0, 130)
-    )
+    return bg_color_top, bg_color_bottom
+
+def build_ffmpeg_command(output_path, width, height, fps, duration, audio_path=None):
+    """Build the ffmpeg command that encodes raw RGB frames read from stdin.
     
-    img_rgba = Image.alpha_composite(img_rgba, overlay)
-    draw = ImageDraw.Draw(img_rgba)
+    Frames are fed at one per second and ffmpeg duplicates them up to
+    ``fps`` on output, so each countdown second is rendered exactly once.
+    """
+    ffmpeg_cmd = [
+        'ffmpeg',
+        '-y',
+        '-loglevel', 'error',
+        '-f', 'rawvideo',
+        '-pix_fmt', 'rgb24',
+        '-s', f'{width}x{height}',
+        '-framerate', '1',
+        '-i', '-',
+    ]
     
-    # Draw label
-    label_x = (width - label_width) // 2
-    label_y = box_y + 30
-    draw.text((label_x + 3, label_y + 3), label_text, fill=(0, 0, 0, 180), font=label_font)
-    draw.text((label_x, label_y), label_text, fill=text_color + (255,), font=label_font)
+    if audio_path and os.path.exists(audio_path):
+        print(f"🎵 Adding background music: {audio_path}")
+        audio_path = normalize_path(audio_path)
+        ffmpeg_cmd.extend([
+            '-i', audio_path,
+            '-t', str(duration),
+            '-c:a', 'aac',
+            '-b:a', '192k',
+            '-shortest',
+        ])
     
-    # Draw timer
-    timer_x = (width - timer_width) // 2
-    timer_y = label_y + 80
-    draw.text((timer_x + 4, timer_y + 4), time_str, fill=(0, 0, 0, 180), font=timer_font)
-    draw.text((timer_x, timer_y), time_str, fill=text_color + (255,), font=timer_font)
+    ffmpeg_cmd.extend([
+        '-r', str(fps),
+        '-c:v', 'libx264',
+        '-preset', 'medium',
+        '-crf', '23',
+        '-pix_fmt', 'yuv420p',
+        output_path
+    ])
     
-    return img_rgba.convert("RGB")
+    return ffmpeg_cmd
 
 def create_countdown_video(duration=300, output_path="output/countdown.mp4", 
                           theme_path="backgrounds/forgiveness/countdown.jpg",
                           fps=30, audio_path=None,
                           church_name="Vernon United Methodist Church",
-                          logo_path=None):
+                          logo_path=None, workers=1):
     """Create countdown video - cross-platform compatible"""
     
     if not check_ffmpeg():
@@ -208,95 +428,268 @@ def create_countdown_video(duration=300, output_path="output/countdown.mp4",
     if logo_path:
         print(f"🏛️ Logo: {logo_path}")
     
-    # Load theme colors
-    bg_color_top = (0, 120, 200)
-    bg_color_bottom = (0, 60, 130)
+    bg_color_top, bg_color_bottom = load_theme_colors(theme_path)
     
-    theme_path = normalize_path(theme_path)
-    if os.path.exists(theme_path):
-        try:
-            theme_img = Image.open(theme_path)
-            bg_color_top = theme_img.getpixel((theme_img.width // 2, 100))
-            bg_color_bottom = theme_img.getpixel((theme_img.width // 2, theme_img.height - 100))
-            print(f"🎨 Using theme colors from {theme_path}")
-        except:
-            print(f"⚠️ Could not load theme, using default colors")
-    
-    # Create temp directory with OS-appropriate path
-    temp_dir = normalize_path("temp_countdown_frames")
-    ensure_directory(temp_dir)
+    output_path = normalize_path(output_path)
     
-    print(f"📸 Generating frames...")
+    print(f"📸 Streaming frames to ffmpeg...")
+    
+    # One frame per second is piped straight into ffmpeg as raw RGB;
+    # ffmpeg repeats each frame up to the output frame rate, so nothing
+    # is JPEG-encoded or written to disk before the final video.
+    width, height = 1920, 1080
+    renderer_kwargs = {
+        'width': width,
+        'height': height,
+        'bg_color_top': bg_color_top,
+        'bg_color_bottom': bg_color_bottom,
+        'church_name': church_name,
+        'logo_path': logo_path,
+    }
+    
+    if workers > 1:
+        print(f"🧵 Rendering with {workers} worker processes")
+    
+    ffmpeg_cmd = build_ffmpeg_command(output_path, width, height, fps, duration, audio_path)
+    print(f"🎞️  Encoding video with ffmpeg...")
+    process = subprocess.Popen(
+        ffmpeg_cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
     
     frame_count = 0
-    for remaining in range(duration, -1, -1):
-        minutes = remaining // 60
-        seconds = remaining % 60
-        
-        frame = create_countdown_frame(
-            minutes, seconds, 
-            bg_color_top=bg_color_top,
-            bg_color_bottom=bg_color_bottom,
-            church_name=church_name,
-            logo_path=logo_path
-        )
-        
-        for _ in range(fps):
-            frame_path = join_paths(temp_dir, f"frame_{frame_count:06d}.jpg")
-            frame.save(frame_path, "JPEG", quality=95)
-            frame_count += 1
+    for remaining, frame_bytes in iter_countdown_frames(duration, renderer_kwargs, workers):
+        try:
+            process.stdin.write(frame_bytes)
+        except BrokenPipeError:
+            # ffmpeg exited early; its stderr explains why
+            break
+        frame_count += 1
         
         if remaining % 30 == 0:
-            print(f"  ⏱️  Generated up to {minutes:02d}:{seconds:02d}")
+            print(f"  ⏱️  Generated up to {remaining // 60:02d}:{remaining % 60:02d}")
     
-    print(f"✅ Generated {frame_count} frames")
-    print(f"🎞️  Encoding video with ffmpeg...")
+    _, stderr = process.communicate()
     
-    # Build ffmpeg command
-    frame_pattern = join_paths(temp_dir, 'frame_%06d.jpg')
+    if process.returncode != 0:
+        print(f"❌ ffmpeg error: {stderr.decode() if stderr else 'Unknown error'}")
+        return False
     
-    ffmpeg_cmd = [
-        'ffmpeg',
-        '-y',
-        '-framerate', str(fps),
-        '-i', frame_pattern,
-    ]
+    print(f"✅ Rendered {frame_count} frames ({frame_count * fps} at {fps} fps)")
+    print(f"✅ Video created: {output_path}")
     
-    if audio_path and os.path.exists(audio_path):
-        print(f"🎵 Adding background music: {audio_path}")
-        audio_path = normalize_path(audio_path)
-        ffmpeg_cmd.extend([
-            '-i', audio_path,
-            '-t', str(duration),
-            '-c:a', 'aac',
-            '-b:a', '192k',
-            '-shortest',
-        ])
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"📦 File size: {size_mb:.1f} MB")
     
-    output_path = normalize_path(output_path)
-    ffmpeg_cmd.extend([
-        '-c:v', 'libx264',
-        '-preset', 'medium',
-        '-crf', '23',
-        '-pix_fmt', 'yuv420p',
-        output_path
-    ])
+    return True
+
+def create_countdown_gif(duration=300, output_path="output/countdown.gif",
+                         theme_path="backgrounds/forgiveness/countdown.jpg",
+                         church_name="Vernon United Methodist Church",
+                         logo_path=None, workers=1):
+    """
+    Create an animated GIF countdown, one frame per second.
+    
+    The palette is quantised once from a full frame. The first frame is
+    stored whole and every following frame stores only the timer region,
+    each held for one second. Frames are streamed to disk as they are
+    rendered, so memory stays flat however long the countdown is.
+    """
+    print(f"🎬 Creating {duration//60} minute countdown GIF...")
+    
+    bg_color_top, bg_color_bottom = load_theme_colors(theme_path)
+    width, height = 1920, 1080
+    renderer_kwargs = {
+        'width': width,
+        'height': height,
+        'bg_color_top': bg_color_top,
+        'bg_color_bottom': bg_color_bottom,
+        'church_name': church_name,
+        'logo_path': logo_path,
+    }
+    # Only needed for where the timer sits; frames come from iter_countdown_frames
+    timer_region = CountdownRenderer(**renderer_kwargs).timer_region
     
-    try:
-        subprocess.run(ffmpeg_cmd, check=True, capture_output=True)
-        print(f"✅ Video created: {output_path}")
-        
-        size_mb = os.path.getsize(output_path) / (1024 * 1024)
-        print(f"📦 File size: {size_mb:.1f} MB")
-        
-        print("🧹 Cleaning up temporary frames...")
-        shutil.rmtree(temp_dir)
+    output_path = normalize_path(output_path)
+    palette = None
+    
+    with open(output_path, 'wb') as f:
+        for remaining, frame_bytes in iter_countdown_frames(duration, renderer_kwargs, workers):
+            frame = Image.frombytes('RGB', (width, height), frame_bytes)
+            if palette is None:
+                # One shared palette for every frame, so tiles can be pasted unchanged
+                palette = frame.quantize(colors=256)
+                first_frame = frame.quantize(palette=palette, dither=Image.Dither.NONE)
+                # duration and loop in the header make Pillow write GIF89a
+                # and the NETSCAPE2.0 loop block
+                header, _ = GifImagePlugin.getheader(
+                    first_frame, info={'optimize': False, 'duration': 1000, 'loop': 0})
+                for chunk in header:
+                    f.write(chunk)
+                for chunk in GifImagePlugin.getdata(first_frame, duration=1000):
+                    f.write(chunk)
+                continue
+            
+            tile = frame.crop(timer_region).quantize(palette=palette, dither=Image.Dither.NONE)
+            for chunk in GifImagePlugin.getdata(tile, offset=timer_region[:2], duration=1000):
+                f.write(chunk)
+            
+            if remaining % 30 == 0:
+                print(f"  ⏱️  Generated up to {remaining // 60:02d}:{remaining % 60:02d}")
         
-        return True
+        f.write(b";")  # GIF trailer
+    
+    print(f"✅ GIF created: {output_path}")
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"📦 File size: {size_mb:.1f} MB")
+    
+    return True
+
+def create_countdown_images(duration=300, output_dir="output/countdown_frames",
+                            theme_path="backgrounds/forgiveness/countdown.jpg",
+                            church_name="Vernon United Methodist Church",
+                            logo_path=None, workers=1):
+    """Write one PNG per countdown second (countdown_0000.png is the first)"""
+    print(f"🎬 Creating {duration//60} minute countdown images...")
+    
+    bg_color_top, bg_color_bottom = load_theme_colors(theme_path)
+    width, height = 1920, 1080
+    renderer_kwargs = {
+        'width': width,
+        'height': height,
+        'bg_color_top': bg_color_top,
+        'bg_color_bottom': bg_color_bottom,
+        'church_name': church_name,
+        'logo_path': logo_path,
+    }
+    
+    output_dir = normalize_path(output_dir)
+    ensure_directory(output_dir)
+    
+    frames = iter_countdown_frames(duration, renderer_kwargs, workers)
+    for index, (remaining, frame_bytes) in enumerate(frames):
+        frame = Image.frombytes("RGB", (width, height), frame_bytes)
+        frame.save(join_paths(output_dir, f"countdown_{index:04d}.png"), "PNG")
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ ffmpeg error: {e.stderr.decode() if e.stderr else 'Unknown error'}")
-        return False
+        if remaining % 30 == 0:
+            print(f"  ⏱️  Generated up to {remaining // 60:02d}:{remaining % 60:02d}")
+    
+    print(f"✅ Wrote {duration + 1} images to {output_dir}")
+    return True
+
+# Bump when frame rendering or encoding changes so cached videos are rebuilt
+COUNTDOWN_RENDER_VERSION = 1
+COUNTDOWN_CACHE_DIR = join_paths('output', 'countdown_cache')
+
+DEFAULT_AUDIO_PATHS = [
+    join_paths('audio', 'countdown_music.mp3'),
+    join_paths('audio', 'church_music.mp3'),
+    join_paths('audio', 'calm_piano.mp3'),
+]
+
+DEFAULT_LOGO_PATHS = [
+    join_paths('logos', 'church_logo.png'),
+    join_paths('logos', 'methodist_logo.png'),
+    join_paths('logos', 'umc_logo.png'),
+]
+
+def find_default_audio():
+    """Return the first default background music file that exists"""
+    for path in DEFAULT_AUDIO_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+def find_default_logo():
+    """Return the first default church logo that exists"""
+    for path in DEFAULT_LOGO_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+def file_digest(path):
+    """SHA-256 of a file's contents, or None if it doesn't exist"""
+    if not path or not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def countdown_cache_key(duration=300, theme_path="backgrounds/forgiveness/countdown.jpg",
+                        fps=30, audio_path=None,
+                        church_name="Vernon United Methodist Church",
+                        logo_path=None):
+    """Hash every input that affects the rendered countdown video"""
+    inputs = {
+        'version': COUNTDOWN_RENDER_VERSION,
+        'duration': duration,
+        'fps': fps,
+        'church_name': church_name,
+        'theme': file_digest(theme_path),
+        'logo': file_digest(logo_path),
+        'audio': file_digest(audio_path),
+    }
+    payload = json.dumps(inputs, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+def find_cached_countdown_video(duration=300,
+                                theme_path="backgrounds/forgiveness/countdown.jpg",
+                                fps=30, audio_path=None,
+                                church_name="Vernon United Methodist Church",
+                                logo_path=None, cache_dir=COUNTDOWN_CACHE_DIR):
+    """Path of an already rendered countdown for these inputs, or None"""
+    key = countdown_cache_key(duration, theme_path, fps, audio_path, church_name, logo_path)
+    cached_path = normalize_path(join_paths(cache_dir, f"countdown_{key}.mp4"))
+    return cached_path if os.path.exists(cached_path) else None
+
+def create_countdown_video_cached(duration=300,
+                                  theme_path="backgrounds/forgiveness/countdown.jpg",
+                                  fps=30, audio_path=None,
+                                  church_name="Vernon United Methodist Church",
+                                  logo_path=None, workers=1,
+                                  cache_dir=COUNTDOWN_CACHE_DIR):
+    """
+    Return a countdown video for these inputs, building it only on a miss.
+    
+    Videos are stored in cache_dir under a hash of every input (including
+    file digests of the theme image, logo and audio), so several variants
+    can live side by side. Returns the video path, or None if it failed.
+    """
+    key = countdown_cache_key(duration, theme_path, fps, audio_path, church_name, logo_path)
+    cached_path = normalize_path(join_paths(cache_dir, f"countdown_{key}.mp4"))
+    
+    if os.path.exists(cached_path):
+        print(f"✅ Using cached countdown video: {cached_path}")
+        return cached_path
+    
+    ensure_directory(cache_dir)
+    # A name of its own, so concurrent builds of the same key never share a file
+    fd, partial_path = tempfile.mkstemp(prefix=f"countdown_{key}.", suffix=".partial.mp4",
+                                        dir=normalize_path(cache_dir))
+    os.close(fd)
+    try:
+        success = create_countdown_video(
+            duration=duration,
+            output_path=partial_path,
+            theme_path=theme_path,
+            fps=fps,
+            audio_path=audio_path,
+            church_name=church_name,
+            logo_path=logo_path,
+            workers=workers
+        )
+        if success:
+            # Only publish complete videos under the cache key
+            os.replace(partial_path, cached_path)
+            return cached_path
+        return None
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
 
 def main():
     parser = argparse.ArgumentParser(description="Generate countdown timer for church slides")
@@ -308,14 +701,25 @@ def main():
     parser.add_argument('--audio', type=str, default=None)
     parser.add_argument('--church-name', type=str, default='Vernon United Methodist Church')
     parser.add_argument('--logo', type=str, default=None)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes used to render frames (default: 1)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Build into output/countdown_cache and reuse a matching video')
     
     args = parser.parse_args()
+    if args.cache and args.format != 'mp4':
+        parser.error("--cache only applies to --format mp4")
     
     # Determine output path
+    default_outputs = {
+        'mp4': join_paths('output', 'countdown.mp4'),
+        'gif': join_paths('output', 'countdown.gif'),
+        'images': join_paths('output', 'countdown_frames'),
+    }
     if args.output:
         output_path = normalize_path(args.output)
     else:
-        output_path = join_paths('output', 'countdown.mp4')
+        output_path = default_outputs[args.format]
     
     ensure_directory(os.path.dirname(output_path) if os.path.dirname(output_path) else 'output')
     
@@ -324,50 +728,74 @@ def main():
     # Handle audio
     audio_path = args.audio
     if not audio_path:
-        default_audio_paths = [
-            join_paths('audio', 'countdown_music.mp3'),
-            join_paths('audio', 'church_music.mp3'),
-            join_paths('audio', 'calm_piano.mp3'),
-        ]
-        for path in default_audio_paths:
-            if os.path.exists(path):
-                audio_path = path
-                print(f"🎵 Found default audio: {audio_path}")
-                break
+        audio_path = find_default_audio()
+        if audio_path:
+            print(f"🎵 Found default audio: {audio_path}")
     
     # Handle logo
     logo_path = args.logo
     if not logo_path:
-        default_logo_paths = [
-            join_paths('logos', 'church_logo.png'),
-            join_paths('logos', 'methodist_logo.png'),
-            join_paths('logos', 'umc_logo.png'),
-        ]
-        for path in default_logo_paths:
-            if os.path.exists(path):
-                logo_path = path
-                print(f"🏛️ Found logo: {logo_path}")
-                break
+        logo_path = find_default_logo()
+        if logo_path:
+            print(f"🏛️ Found logo: {logo_path}")
     
     if logo_path and not os.path.exists(logo_path):
         print(f"⚠️ Logo not found: {logo_path}")
         logo_path = None
     
     # Generate countdown
-    success = create_countdown_video(
-        duration=args.duration,
-        output_path=output_path,
-        theme_path=theme_path,
-        fps=args.fps,
-        audio_path=audio_path,
-        church_name=args.church_name,
-        logo_path=logo_path
-    )
+    if args.format == 'gif':
+        success = create_countdown_gif(
+            duration=args.duration,
+            output_path=output_path,
+            theme_path=theme_path,
+            church_name=args.church_name,
+            logo_path=logo_path,
+            workers=args.workers
+        )
+    elif args.format == 'images':
+        success = create_countdown_images(
+            duration=args.duration,
+            output_dir=output_path,
+            theme_path=theme_path,
+            church_name=args.church_name,
+            logo_path=logo_path,
+            workers=args.workers
+        )
+    elif args.cache:
+        cached_path = create_countdown_video_cached(
+            duration=args.duration,
+            theme_path=theme_path,
+            fps=args.fps,
+            audio_path=audio_path,
+            church_name=args.church_name,
+            logo_path=logo_path,
+            workers=args.workers
+        )
+        success = cached_path is not None
+        if success and args.output:
+            # Publish a copy where the caller asked; the cache keeps its own
+            partial_path = f"{output_path}.partial"
+            shutil.copyfile(cached_path, partial_path)
+            os.replace(partial_path, output_path)
+        elif success:
+            output_path = cached_path
+    else:
+        success = create_countdown_video(
+            duration=args.duration,
+            output_path=output_path,
+            theme_path=theme_path,
+            fps=args.fps,
+            audio_path=audio_path,
+            church_name=args.church_name,
+            logo_path=logo_path,
+            workers=args.workers
+        )
     
     if success:
         print("\n✅ Done!")
-        print(f"🎬 Video: {output_path}")
-        if audio_path:
+        print(f"🎬 Output: {output_path}")
+        if audio_path and args.format == 'mp4':
             print(f"🎵 Includes background music")
         if logo_path:
             print(f"🏛️ Includes church logo")
@@ -1,21 +1,63 @@
 import yaml
 import os
 import sys
-from src.tools.pptx_creator_tool import create_powerpoint_manual
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.tools.pptx_builder import create_powerpoint_manual
+from src.tools.slide_splitter import split_slides
+from src.tools.background_index import BackgroundIndex
+from src.tools.service_items import item_to_slide
+from src.tools.service_model import load_service_data
+from src.telemetry import RunTelemetry, SPANS_SUFFIX
+from src.tools.image_utils import parse_resolution
+from create_countdown import (
+    create_countdown_video_cached, find_cached_countdown_video, find_default_audio, find_default_logo
+)
 
-def simple_convert(service_date):
-    """Direct YAML to PowerPoint conversion without AI agents"""
-    
-    # Load YAML
-    yaml_path = f"service_orders/{service_date}.yaml"
+SERVICE_ORDERS_DIR = "service_orders"
+
+def load_service_yaml(service_date):
+    """Load service_orders/<date>.yaml, or print an error and return None"""
+    yaml_path = f"{SERVICE_ORDERS_DIR}/{service_date}.yaml"
     if not os.path.exists(yaml_path):
         print(f"❌ File not found: {yaml_path}")
-        return
+        return None
+    
+    try:
+        return load_service_data(yaml_path)
+    except yaml.YAMLError as e:
+        print(f"❌ Invalid YAML in {yaml_path}: {e}")
+        return None
+
+def service_theme(data):
+    """Theme folder name for a loaded service order"""
+    return data.get('theme', 'default').lower().replace(' ', '_')
+
+def countdown_settings(theme):
+    """Inputs for the countdown video of a theme (shared with the cache key)"""
+    return {
+        'theme_path': os.path.join('backgrounds', theme, 'countdown.jpg'),
+        'audio_path': find_default_audio(),
+        'logo_path': find_default_logo(),
+    }
+
+def simple_convert(service_date, target_resolution=None, background_index=None):
+    """
+    Direct YAML to PowerPoint conversion without AI agents
+    
+    Returns the path of the saved deck, or None if nothing was built.
+    Stage timings are appended to <deck>.spans.jsonl.
+    """
+    telemetry = RunTelemetry("simple_convert", service_date)
     
-    with open(yaml_path, 'r') as f:
-        data = yaml.safe_load(f)
+    # Load YAML
+    with telemetry.span("load_yaml"):
+        data = load_service_yaml(service_date)
+    if data is None:
+        return None
     
-    theme = data.get('theme', 'default').lower().replace(' ', '_')
+    theme = service_theme(data)
     backgrounds_path = f"backgrounds/{theme}"
     
     if not os.path.exists(backgrounds_path):
@@ -31,118 +73,60 @@ def simple_convert(service_date):
     if not order_items:
         print("❌ No service order found in YAML file!")
         print("   Looking for 'order:' or 'service_order:' key")
-        return
+        return None
     
     print(f"📋 Found {len(order_items)} items in service order")
     
-    # Check if we need to generate countdown video
+    # Check if we need to generate countdown video. A cached one is used
+    # directly; otherwise it renders in another process while the slides
+    # are built, and the builder embeds it into slide 1 last.
     countdown_video_path = None
+    countdown_future = None
+    countdown_finished = []
     if order_items and order_items[0].get('type') == 'countdown':
-        countdown_video_path = 'output/countdown.mp4'
-        
-        if not os.path.exists(countdown_video_path):
-            print(f"\n⏱️  Generating 5-minute countdown video...")
-            print(f"   This will take about 30 seconds...")
-            
-            import subprocess
-            try:
-                subprocess.run([
-                    'python', 'create_countdown.py',
-                    '--format', 'mp4',
-                    '--theme', theme,
-                    '--output', countdown_video_path
-                ], check=True, capture_output=True)
-                print(f"✅ Countdown video generated: {countdown_video_path}")
-            except subprocess.CalledProcessError as e:
-                print(f"⚠️ Could not generate countdown video: {e}")
-                print(f"   Video will need to be added manually")
-                countdown_video_path = None
-            except FileNotFoundError:
-                print(f"⚠️ create_countdown.py not found - skipping video generation")
-                countdown_video_path = None
-        else:
-            print(f"✅ Using existing countdown video: {countdown_video_path}")
+        print(f"\n⏱️  Preparing 5-minute countdown video...")
+        settings = countdown_settings(theme)
+        with telemetry.span("countdown") as span:
+            countdown_video_path = find_cached_countdown_video(**settings)
+            if countdown_video_path:
+                print(f"✅ Using cached countdown video: {countdown_video_path}")
+            else:
+                print(f"   Rendering in the background while the slides are built")
+                executor = ProcessPoolExecutor(max_workers=1)
+                countdown_submitted = time.perf_counter()
+                countdown_future = executor.submit(create_countdown_video_cached, **settings)
+                countdown_future.add_done_callback(
+                    lambda future: countdown_finished.append(time.perf_counter()))
+                executor.shutdown(wait=False)
+                span["rendering"] = "background"
     
-    # Convert YAML to slides
-    slides = []
-    for idx, item in enumerate(order_items):
-        slide_type = item.get('type', 'text')
-        title = item.get('title', '')
+    with telemetry.span("slides") as span:
+        # Convert YAML to slides
+        slides = []
+        for idx, item in enumerate(order_items):
+            slide_data = item_to_slide(item, backgrounds_path)
+            slide_type = slide_data['type']
+            title = slide_data['title']
         
-        # Get content - could be 'content' or 'reference' for scripture
-        content = item.get('content', '')
-        if not content and 'reference' in item:
-            content = item.get('reference', '')
+            # Add countdown video to first slide if it's a countdown type
+            if idx == 0 and slide_type == 'countdown' and countdown_video_path:
+                slide_data['countdown_video'] = countdown_video_path
         
-        # Special handling for SERMON slides
-        if slide_type == 'sermon':
-            # Build sermon slide content
-            sermon_parts = []
-            
-            # Add the sermon title
-            if title:
-                sermon_parts.append(title)
-            
-            # Add speaker information
-            if 'speaker' in item:
-                sermon_parts.append("")  # Blank line
-                sermon_parts.append(item['speaker'])
-            elif 'presenter' in item:
-                sermon_parts.append("")  # Blank line
-                sermon_parts.append(item['presenter'])
-            
-            # Combine into content
-            content = '\n'.join(sermon_parts)
-            
-            # Use "Sermon" as the title for the slide (displays at top)
-            title = "Sermon"
+            slides.append(slide_data)
         
-        # Handle other slide types with speaker/presenter info
-        elif 'speaker' in item or 'presenter' in item:
-            presenter_name = item.get('speaker') or item.get('presenter')
-            
-            if content:
-                content += f"\n\n{presenter_name}"
+            # Enhanced logging for sermon slides
+            if slide_type == 'sermon':
+                print(f"  ✓ Added slide: Sermon - {item.get('title', 'Untitled')} ({slide_type})")
             else:
-                content = presenter_name
-        
-        # Map slide type to background
-        bg_map = {
-            'countdown': 'countdown.jpg',
-            'song': 'song.jpg',
-            'hymn': 'hymn.jpg',
-            'prayer': 'prayer.jpg',
-            'scripture': 'scripture.jpg',
-            'sermon': 'sermon.jpg',
-            'communion': 'communion.jpg',
-            'offering': 'offering.jpg',
-            'children_message': 'children.jpg',
-            'liturgy': 'liturgy.jpg',
-            'text': 'general.jpg',
-            'dismissal': 'general.jpg',
-        }
-        
-        bg_file = bg_map.get(slide_type, 'general.jpg')
-        bg_path = os.path.join(backgrounds_path, bg_file)
-        
-        slide_data = {
-            'type': slide_type,
-            'title': title,
-            'content': content,
-            'background_path': bg_path
-        }
-        
-        # Add countdown video to first slide if it's a countdown type
-        if idx == 0 and slide_type == 'countdown' and countdown_video_path:
-            slide_data['countdown_video'] = countdown_video_path
-        
-        slides.append(slide_data)
-        
-        # Enhanced logging for sermon slides
-        if slide_type == 'sermon':
-            print(f"  ✓ Added slide: Sermon - {item.get('title', 'Untitled')} ({slide_type})")
-        else:
-            print(f"  ✓ Added slide: {title} ({slide_type})")
+                print(f"  ✓ Added slide: {title} ({slide_type})")
+    
+        # Split long content into "(Part N)" slides that fit the text box
+        item_count = len(slides)
+        slides = split_slides(slides)
+        if len(slides) > item_count:
+            print(f"✂️  Split long content: {item_count} items -> {len(slides)} slides")
+    
+        span["slides"] = len(slides)
     
     # Create PowerPoint
     theme_clean = theme.replace('_', '')
@@ -150,9 +134,38 @@ def simple_convert(service_date):
     os.makedirs("output", exist_ok=True)
     
     print(f"\n🎬 Creating PowerPoint presentation...")
-    result = create_powerpoint_manual(slides, output_path, backgrounds_path)
+    with telemetry.span("pptx") as span:
+        result = create_powerpoint_manual(slides, output_path, backgrounds_path,
+                                          target_resolution=target_resolution,
+                                          background_index=background_index,
+                                          countdown_video=countdown_future)
+        # The builder reports failure in its message; a deck from an
+        # earlier run may still be on disk
+        saved = result.startswith("✅")
+        if saved:
+            span["bytes_written"] = os.path.getsize(output_path)
+        else:
+            span["status"] = "error"
     print(result)
     
+    if countdown_future:
+        try:
+            countdown_video_path = countdown_future.result()
+        except Exception:
+            countdown_video_path = None
+        if not countdown_video_path:
+            print(f"⚠️ Could not generate countdown video")
+            print(f"   Video will need to be added manually")
+        # The render overlapped the slide and pptx stages (any wait for it
+        # is inside the pptx span). Done callbacks can run just after
+        # result() returns, hence the fallback.
+        finished = countdown_finished[0] if countdown_finished else time.perf_counter()
+        telemetry.add_span("countdown_render", finished - countdown_submitted,
+                           background=True, status="ok" if countdown_video_path else "error")
+    
+    if not saved:
+        return None
+    
     # Display video setup instructions if countdown video exists
     if countdown_video_path and os.path.exists(countdown_video_path):
         print(f"\n" + "="*70)
@@ -169,8 +182,246 @@ def simple_convert(service_date):
         print(f"\n📖 See setup_countdown_autoplay.md for detailed instructions")
         print("="*70)
     
+    telemetry.write(output_path + SPANS_SUFFIX)
+    telemetry.print_summary()
     print(f"\n✅ Done! Open your presentation: {output_path}")
+    return output_path
+
+def find_service_dates(pattern="*.yaml", date_from=None, date_to=None):
+    """Service dates with a YAML file in service_orders/, optionally in a range"""
+    dates = []
+    for path in glob.glob(os.path.join(SERVICE_ORDERS_DIR, pattern)):
+        service_date = os.path.splitext(os.path.basename(path))[0]
+        # ISO dates compare correctly as strings
+        if date_from and service_date < date_from:
+            continue
+        if date_to and service_date > date_to:
+            continue
+        dates.append(service_date)
+    return sorted(dates)
+
+def prepare_countdowns(service_dates):
+    """
+    Build each distinct countdown video once, up front, so parallel deck
+    builds all hit the countdown cache instead of racing to render it.
+    """
+    themes = set()
+    for service_date in service_dates:
+        data = load_service_yaml(service_date)
+        if not data:
+            continue
+        order_items = data.get('order', data.get('service_order', []))
+        if order_items and order_items[0].get('type') == 'countdown':
+            themes.add(service_theme(data))
+    
+    for theme in sorted(themes):
+        create_countdown_video_cached(**countdown_settings(theme))
+
+# Per-process state for batch conversion
+_batch_index = None
+
+def _init_batch_worker(target_resolution):
+    """Process pool initializer: scan backgrounds once per worker"""
+    global _batch_index
+    _batch_index = BackgroundIndex("backgrounds", target_resolution)
+
+def _convert_in_worker(service_date, target_resolution):
+    """Convert one date inside a batch worker; never raises"""
+    try:
+        return service_date, simple_convert(service_date, target_resolution, _batch_index)
+    except Exception as e:
+        print(f"❌ {service_date}: {e}")
+        return service_date, None
+
+def batch_convert(service_dates, target_resolution=None, workers=None):
+    """
+    Convert many service dates in one run, across a process pool.
+    
+    Each worker loads python-pptx and scans the backgrounds folder once
+    and reuses them for every deck it builds; countdown videos are shared
+    through the countdown cache. Returns {date: output path or None}.
+    """
+    if target_resolution:
+        try:
+            parse_resolution(target_resolution)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return {}
+    
+    start = time.perf_counter()
+    print(f"📚 Batch converting {len(service_dates)} service orders...")
+    
+    prepare_countdowns(service_dates)
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(service_dates)))
+    
+    results = {}
+    if workers == 1:
+        _init_batch_worker(target_resolution)
+        for service_date in service_dates:
+            results[service_date] = _convert_in_worker(service_date, target_resolution)[1]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_batch_worker,
+                                 initargs=(target_resolution,)) as pool:
+            futures = [pool.submit(_convert_in_worker, service_date, target_resolution)
+                       for service_date in service_dates]
+            for future in futures:
+                service_date, output_path = future.result()
+                results[service_date] = output_path
+    
+    elapsed = time.perf_counter() - start
+    built = sum(1 for path in results.values() if path)
+    print(f"\n" + "="*70)
+    print(f"📚 BATCH SUMMARY: {built}/{len(results)} decks in {elapsed:.1f}s ({workers} workers)")
+    print("="*70)
+    for service_date, output_path in results.items():
+        print(f"  {'✅' if output_path else '❌'} {service_date}: {output_path or 'failed'}")
+    
+    return results
+
+def _snapshot_inputs():
+    """(mtime, size) of every service YAML and background image, by path"""
+    snapshot = {}
+    for folder, recurse in ((SERVICE_ORDERS_DIR, False), ("backgrounds", True)):
+        for root, dirs, files in os.walk(folder):
+            if not recurse:
+                dirs[:] = []
+            for name in files:
+                if not name.lower().endswith(('.yaml', '.yml', '.jpg', '.jpeg', '.png')):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+def _affected_dates(changed_paths, themes_by_date):
+    """Service dates whose deck depends on any of the changed files"""
+    dates = set()
+    changed_themes = set()
+    for path in changed_paths:
+        parts = os.path.normpath(path).split(os.sep)
+        if parts[0] == SERVICE_ORDERS_DIR:
+            service_date = os.path.splitext(parts[-1])[0]
+            if os.path.exists(path):
+                dates.add(service_date)
+        elif parts[0] == "backgrounds" and len(parts) > 2:
+            changed_themes.add(parts[1])
+    
+    for service_date, theme in themes_by_date.items():
+        # default/ backs up every theme, so a change there touches all decks
+        if theme in changed_themes or "default" in changed_themes:
+            dates.add(service_date)
+    return sorted(dates)
+
+def watch(target_resolution=None, interval=1.0, debounce=1.5):
+    """
+    Rebuild decks whenever their service YAML or backgrounds change.
+    
+    Polls service_orders/ and backgrounds/ (no external watcher needed),
+    waits until edits have settled for `debounce` seconds, then rebuilds
+    only the affected decks. python-pptx and the background index stay
+    loaded between rebuilds. Stop with Ctrl+C.
+    """
+    background_index = BackgroundIndex("backgrounds", target_resolution)
+    themes_by_date = {}
+    for service_date in find_service_dates():
+        data = load_service_yaml(service_date)
+        if data:
+            themes_by_date[service_date] = service_theme(data)
+    
+    snapshot = _snapshot_inputs()
+    pending = set()
+    last_change = 0.0
+    
+    print(f"👀 Watching {SERVICE_ORDERS_DIR}/ and backgrounds/ (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            current = _snapshot_inputs()
+            changed = {path for path in current.keys() | snapshot.keys()
+                       if current.get(path) != snapshot.get(path)}
+            snapshot = current
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+                continue
+            
+            if not pending or time.monotonic() - last_change < debounce:
+                continue
+            
+            if any(not path.startswith(SERVICE_ORDERS_DIR) for path in pending):
+                # Backgrounds changed: rescan once, not per deck
+                background_index = BackgroundIndex("backgrounds", target_resolution)
+            
+            for path in pending:
+                if path.startswith(SERVICE_ORDERS_DIR):
+                    service_date = os.path.splitext(os.path.basename(path))[0]
+                    data = load_service_yaml(service_date) if os.path.exists(path) else None
+                    if data:
+                        themes_by_date[service_date] = service_theme(data)
+                    else:
+                        themes_by_date.pop(service_date, None)
+            
+            dates = _affected_dates(pending, themes_by_date)
+            pending.clear()
+            
+            for service_date in dates:
+                print(f"\n🔄 Change detected, rebuilding {service_date}...")
+                start = time.perf_counter()
+                try:
+                    output_path = simple_convert(service_date, target_resolution, background_index)
+                except Exception as e:
+                    print(f"❌ {service_date}: {e}")
+                    continue
+                if output_path:
+                    print(f"⚡ Rebuilt {output_path} in {time.perf_counter() - start:.1f}s")
+            print(f"\n👀 Watching for changes...")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
 
 if __name__ == "__main__":
-    date = sys.argv[1] if len(sys.argv) > 1 else "2025-10-12"
-    simple_convert(date)
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert a service order YAML to PowerPoint")
+    parser.add_argument('service_date', nargs='?', default="2025-10-12",
+                        help='Service date (YYYY-MM-DD)')
+    parser.add_argument('--resolution', default=None,
+                        help='Use background variants at this size, e.g. 1280x720 or 720p')
+    parser.add_argument('--all', action='store_true',
+                        help='Convert every service_orders/*.yaml in one run')
+    parser.add_argument('--from', dest='date_from', default=None,
+                        help='Batch: first service date to include (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='date_to', default=None,
+                        help='Batch: last service date to include (YYYY-MM-DD)')
+    parser.add_argument('--glob', dest='pattern', default=None,
+                        help="Batch: service_orders file pattern, e.g. '2025-1*.yaml'")
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Batch: worker processes (default: one per CPU)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and rebuild decks when YAML or backgrounds change')
+    args = parser.parse_args()
+    
+    if args.watch:
+        if args.resolution:
+            try:
+                parse_resolution(args.resolution)
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+        watch(target_resolution=args.resolution)
+        sys.exit(0)
+    
+    if args.all or args.date_from or args.date_to or args.pattern:
+        dates = find_service_dates(args.pattern or "*.yaml", args.date_from, args.date_to)
+        if not dates:
+            print(f"❌ No service orders matched in {SERVICE_ORDERS_DIR}/")
+            sys.exit(1)
+        results = batch_convert(dates, target_resolution=args.resolution, workers=args.workers)
+        sys.exit(0 if all(results.values()) else 1)
+    
+    simple_convert(args.service_date, target_resolution=args.resolution)
@@ -2,35 +2,25 @@
 import yaml
 import os
 import sys
-import subprocess
-from src.tools.pptx_creator_tool import create_powerpoint_manual
+from src.tools.pptx_builder import create_powerpoint_manual
+from src.tools.slide_splitter import split_slides
+from src.tools.service_items import item_to_slide
+from create_countdown import create_countdown_video_cached, find_default_audio, find_default_logo
 
-def generate_countdown_video(theme, output_path="output/countdown.mp4"):
-    """Generate countdown video if it doesn't exist"""
-    if os.path.exists(output_path):
-        print(f"⏱️  Using existing countdown: {output_path}")
-        return output_path
-    
-    print(f"⏱️  Generating countdown video...")
-    theme_bg = f"backgrounds/{theme}/countdown.jpg"
-    
-    # Call the countdown generator
-    cmd = [
-        "python", "create_countdown.py",
-        "--format", "mp4",
-        "--duration", "300",
-        "--theme", theme,
-        "--output", output_path
-    ]
-    
-    try:
-        subprocess.run(cmd, check=True)
-        return output_path
-    except subprocess.CalledProcessError:
+def generate_countdown_video(theme):
+    """Return a cached countdown video for this theme, building it if needed"""
+    print(f"⏱️  Preparing countdown video...")
+    countdown_video_path = create_countdown_video_cached(
+        duration=300,
+        theme_path=f"backgrounds/{theme}/countdown.jpg",
+        audio_path=find_default_audio(),
+        logo_path=find_default_logo()
+    )
+    if not countdown_video_path:
         print("⚠️  Could not generate countdown video, skipping...")
-        return None
+    return countdown_video_path
 
-def simple_convert(service_date, include_countdown=True):
+def simple_convert(service_date, include_countdown=True, target_resolution=None):
     """Direct YAML to PowerPoint conversion with optional countdown"""
     
     # Load YAML
@@ -64,41 +54,9 @@ def simple_convert(service_date, include_countdown=True):
     # Convert YAML to slides
     slides = []
     for idx, item in enumerate(order_items):
-        slide_type = item.get('type', 'text')
-        title = item.get('title', '')
-        content = item.get('content', '')
-        
-        # Add speaker/presenter info
-        if 'speaker' in item:
-            content = f"{content}\n\nSpeaker: {item['speaker']}" if content else f"Speaker: {item['speaker']}"
-        elif 'presenter' in item:
-            content = f"{content}\n\nPresenter: {item['presenter']}" if content else f"Presenter: {item['presenter']}"
-        
-        # Map slide type to background
-        bg_map = {
-            'countdown': 'countdown.jpg',
-            'song': 'song.jpg',
-            'hymn': 'hymn.jpg',
-            'prayer': 'prayer.jpg',
-            'scripture': 'scripture.jpg',
-            'sermon': 'sermon.jpg',
-            'communion': 'communion.jpg',
-            'offering': 'offering.jpg',
-            'children_message': 'children.jpg',
-            'liturgy': 'liturgy.jpg',
-            'text': 'general.jpg',
-            'dismissal': 'general.jpg',
-        }
-        
-        bg_file = bg_map.get(slide_type, 'general.jpg')
-        bg_path = os.path.join(backgrounds_path, bg_file)
-        
-        slide_data = {
-            'type': slide_type,
-            'title': title,
-            'content': content,
-            'background_path': bg_path
-        }
+        slide_data = item_to_slide(item, backgrounds_path)
+        slide_type = slide_data['type']
+        title = slide_data['title']
         
         # Add countdown video path to first slide if available
         if idx == 0 and countdown_video_path:
@@ -107,13 +65,20 @@ def simple_convert(service_date, include_countdown=True):
         slides.append(slide_data)
         print(f"  ✓ Added slide: {title} ({slide_type})")
     
+    # Split long content into "(Part N)" slides that fit the text box
+    item_count = len(slides)
+    slides = split_slides(slides)
+    if len(slides) > item_count:
+        print(f"✂️  Split long content: {item_count} items -> {len(slides)} slides")
+    
     # Create PowerPoint
     theme_clean = theme.replace('_', '')
     output_path = f"output/{service_date}_{theme_clean}_ServiceSlides.pptx"
     os.makedirs("output", exist_ok=True)
     
     print(f"\n🎬 Creating PowerPoint presentation...")
-    result = create_powerpoint_manual(slides, output_path, backgrounds_path)
+    result = create_powerpoint_manual(slides, output_path, backgrounds_path,
+                                      target_resolution=target_resolution)
     print(result)
     
     if countdown_video_path:
@@ -128,6 +93,9 @@ if __name__ == "__main__":
     parser.add_argument('service_date', help='Service date (YYYY-MM-DD)')
     parser.add_argument('--no-countdown', action='store_true', 
                        help='Skip countdown video generation')
+    parser.add_argument('--resolution', default=None,
+                       help='Use background variants at this size, e.g. 1280x720 or 720p')
     args = parser.parse_args()
     
-    simple_convert(args.service_date, include_countdown=not args.no_countdown)
\ No newline at end of file
+    simple_convert(args.service_date, include_countdown=not args.no_countdown,
+                   target_resolution=args.resolution)
\ No newline at end of file
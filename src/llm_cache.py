@@ -0,0 +1,138 @@
+"""
+Persistent cache of LLM responses for the CrewAI pipeline.
+
+Responses are stored in SQLite, keyed by a hash of the model and the full
+prompt messages (agent role/backstory, task description and the rendered
+service data all end up in those). Rerunning an unchanged service - or
+one where only later items changed - replays the saved answers instead of
+waiting on Ollama. The least recently used entries are evicted once the
+cache grows past its size limit.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from crewai import LLM
+from src.telemetry import record_llm_call, estimate_tokens
+
+LLM_CACHE_PATH = os.path.join("output", "llm_cache.sqlite")
+LLM_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Bump when the key layout or what a cached response means changes;
+# older entries then simply stop matching
+LLM_CACHE_VERSION = 2
+
+# LLM settings that change the answer: the endpoint and sampling parameters
+LLM_KEY_PARAMS = (
+    "base_url", "api_base", "api_version", "temperature", "top_p", "n", "stop",
+    "max_tokens", "max_completion_tokens", "presence_penalty", "frequency_penalty",
+    "logit_bias", "response_format", "seed", "reasoning_effort",
+)
+
+
+def cache_key(model, messages, params=None):
+    """
+    Digest of everything that determines an LLM response: the model, the
+    prompt messages and the endpoint/sampling parameters (params)
+    """
+    payload = json.dumps({"version": LLM_CACHE_VERSION, "model": model,
+                          "params": params or {}, "messages": messages},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed response store with least-recently-used eviction"""
+
+    def __init__(self, path=LLM_CACHE_PATH, max_bytes=LLM_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, model TEXT, response TEXT,"
+            " size INTEGER, last_used REAL)"
+        )
+        self._db.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return row[0]
+
+    def put(self, key, model, response):
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, size, time.time()),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def summary(self):
+        return f"💾 LLM cache: {self.hits} hit(s), {self.misses} miss(es) ({self.path})"
+
+
+class CachedLLM(LLM):
+    """
+    crewai LLM that answers repeated prompts from an LLMCache. With
+    refresh=True the model is always queried and the cache is overwritten.
+    """
+
+    def __init__(self, model, cache, refresh=False, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.response_cache = cache
+        self.refresh = refresh
+
+    def key_params(self, tools=None):
+        """This LLM's answer-changing settings, plus any tools offered to it"""
+        params = {name: getattr(self, name, None) for name in LLM_KEY_PARAMS}
+        params = {name: value for name, value in params.items() if value is not None}
+        if tools:
+            params["tools"] = tools
+        return params
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        key = cache_key(self.model, messages, self.key_params(tools))
+        if not self.refresh:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                record_llm_call(estimate_tokens(messages), estimate_tokens(cached), cached=True)
+                return cached
+
+        response = super().call(messages, tools=tools, callbacks=callbacks,
+                                available_functions=available_functions, **kwargs)
+        record_llm_call(estimate_tokens(messages), estimate_tokens(response))
+        # Only plain text answers are cached; tool calls must really run
+        if isinstance(response, str):
+            self.response_cache.put(key, self.model, response)
+        return response
@@ -2,8 +2,15 @@ import argparse
 import yaml
 import os
 import json
-from .service_crew import build_crew
+from .service_crew import (
+    build_crew, classify_items, select_background_folder, deck_output_path, llm_cache_summary,
+    CREW_LLM_CALLS
+)
 from .tools.pptx_creator_tool import create_service_slides
+from .tools.pptx_builder import create_powerpoint_manual
+from .tools.service_items import KNOWN_TYPES, is_structured, item_to_slide
+from .tools.slide_splitter import split_slides
+from .telemetry import RunTelemetry, SPANS_SUFFIX
 
 
 def recursive_date_to_str(data):
@@ -78,16 +85,82 @@ def extract_slides_json(crew_result):
         raise
 
 
+def run_hybrid(service_data, service_date, theme, backgrounds_path, output_dir, telemetry,
+               skip_pptx=False, use_cache=True):
+    """
+    Build the deck with rules for every item that has a recognised type and
+    the LLM only for the rest (in a single request). Prints how many LLM
+    calls this saved compared to the full crew.
+    """
+    theme_backgrounds_path = select_background_folder(backgrounds_path, theme)
+    output_path = deck_output_path(output_dir, theme, service_date)
+    order_items = service_data.get("order", service_data.get("service_order", []))
+    
+    with telemetry.span("rules") as rules_span:
+        slides = [None] * len(order_items)
+        pending = []
+        for idx, item in enumerate(order_items):
+            if is_structured(item):
+                slides[idx] = item_to_slide(item, theme_backgrounds_path)
+            else:
+                pending.append(idx)
+        rules_span["items"] = len(order_items) - len(pending)
+    
+    llm_calls = 0
+    llm_time = 0.0
+    if pending:
+        print(f"🤖 Sending {len(pending)} unrecognised item(s) to the LLM...")
+        with telemetry.span("llm_classify", items=len(pending)) as llm_span:
+            classified = classify_items([order_items[idx] for idx in pending], KNOWN_TYPES, use_cache)
+        llm_time = llm_span["wall_s"]
+        llm_calls = 1
+        for idx, item in zip(pending, classified):
+            slides[idx] = item_to_slide(item, theme_backgrounds_path)
+    
+    with telemetry.span("split") as span:
+        slides = split_slides(slides)
+        span["slides"] = len(slides)
+    
+    print(f"\n📊 Hybrid pipeline metrics")
+    print(f"   Items: {len(order_items)} (rules: {len(order_items) - len(pending)}, LLM: {len(pending)})")
+    print(f"   LLM calls: {llm_calls} (full crew: {CREW_LLM_CALLS}, avoided: {CREW_LLM_CALLS - llm_calls})")
+    print(f"   Time: rules {rules_span['wall_s']*1000:.1f}ms, LLM {llm_time:.1f}s")
+    print(f"   Slides: {len(slides)}\n")
+    
+    if skip_pptx:
+        json_path = output_path.replace(".pptx", ".json")
+        os.makedirs(output_dir, exist_ok=True)
+        with telemetry.span("write_json") as span:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(slides, f, indent=2)
+            span["bytes_written"] = os.path.getsize(json_path)
+        print(f"💾 Saved JSON to: {json_path}")
+        return
+    
+    print(f"🖼️  Creating PowerPoint presentation...")
+    with telemetry.span("pptx") as span:
+        confirmation = create_powerpoint_manual(slides, output_path, theme_backgrounds_path)
+        if os.path.exists(output_path):
+            span["bytes_written"] = os.path.getsize(output_path)
+    print(f"\n{confirmation}")
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--service-date", required=True, help="Service date, e.g. 2025-09-28")
     parser.add_argument("--skip-pptx", action="store_true", help="Skip PowerPoint generation (debugging)")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Convert typed items by rule and use the LLM only for the rest")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached LLM responses and query the model again (refreshes the cache)")
     args = parser.parse_args()
 
     service_date = args.service_date
+    telemetry = RunTelemetry("hybrid" if args.hybrid else "crew", service_date)
 
     try:
-        service_data = load_service_order(service_date)
+        with telemetry.span("load_service_order"):
+            service_data = load_service_order(service_date)
     except FileNotFoundError as e:
         print(f"❌ {e}")
         return
@@ -95,35 +168,70 @@ def main():
     theme = service_data.get("theme", "default")
     backgrounds_path = "backgrounds"
     output_dir = "output"
+    output_path = deck_output_path(output_dir, theme, service_date)
+
+    try:
+        if args.hybrid:
+            print(f"\n🎉 Generating slides for {service_date} (Theme: {theme}, hybrid mode)\n")
+            run_hybrid(service_data, service_date, theme, backgrounds_path, output_dir, telemetry,
+                       args.skip_pptx, use_cache=not args.no_cache)
+            if llm_cache_summary():
+                print(llm_cache_summary())
+            return
+
+        run_crew(args, service_data, service_date, theme, backgrounds_path, output_dir, telemetry)
+    finally:
+        telemetry.write(output_path + SPANS_SUFFIX)
+        telemetry.print_summary()
 
+
+def run_crew(args, service_data, service_date, theme, backgrounds_path, output_dir, telemetry):
+    """Full agent pipeline: crew.kickoff, then JSON extraction and the deck"""
     # Build the crew (now without the PPTX creator agent)
-    crew, theme_backgrounds_path, output_path = build_crew(
-        backgrounds_path=backgrounds_path,
-        output_dir=output_dir,
-        theme=theme,
-        service_date=service_date,
-    )
+    with telemetry.span("build_crew"):
+        crew, theme_backgrounds_path, output_path = build_crew(
+            backgrounds_path=backgrounds_path,
+            output_dir=output_dir,
+            theme=theme,
+            service_date=service_date,
+            use_cache=not args.no_cache,
+        )
 
     print(f"\n🎉 Generating slides for {service_date} (Theme: {theme})\n")
 
     # Run the crew (stops at the designer agent)
-    result = crew.kickoff(
-        inputs={
-            "service_date": service_date,
-            "service_data": service_data,
-            "backgrounds_path": theme_backgrounds_path,
-            "output_dir": output_dir,
-        }
-    )
+    with telemetry.span("kickoff", tasks=len(crew.tasks)) as span:
+        result = crew.kickoff(
+            inputs={
+                "service_date": service_date,
+                "service_data": service_data,
+                "backgrounds_path": theme_backgrounds_path,
+                "output_dir": output_dir,
+            }
+        )
+        # Real usage from CrewAI when it reports it; extra calls are retries
+        usage = getattr(result, "token_usage", None)
+        if getattr(usage, "prompt_tokens", None):
+            span["prompt_tokens"] = usage.prompt_tokens
+            span["completion_tokens"] = usage.completion_tokens
+        span["retries"] = max(0, span.get("llm_calls", 0) - span.get("cache_hits", 0) - len(crew.tasks))
 
     print("\n✅ Crew processing complete!")
+    if llm_cache_summary():
+        print(llm_cache_summary())
     print(f"Result type: {type(result)}\n")
 
     # Extract the slides JSON from the crew result
     try:
-        slides_json = extract_slides_json(result)
+        with telemetry.span("extract_slides_json"):
+            slides_json = extract_slides_json(result)
         print(f"📋 Extracted {len(slides_json)} slides from crew output")
         
+        # Split long content into "(Part N)" slides that fit the text box
+        with telemetry.span("split"):
+            slides_json = split_slides(slides_json)
+        print(f"✂️  {len(slides_json)} slides after splitting long content")
+        
         # Debug: Print first slide
         if slides_json and len(slides_json) > 0:
             print(f"\n📝 First slide preview:")
@@ -135,14 +243,19 @@ def main():
             print("\n⏭️  Skipping PowerPoint generation (--skip-pptx flag)")
             # Optionally save JSON for debugging
             json_path = output_path.replace(".pptx", ".json")
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(slides_json, f, indent=2)
+            with telemetry.span("write_json") as span:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(slides_json, f, indent=2)
+                span["bytes_written"] = os.path.getsize(json_path)
             print(f"💾 Saved JSON to: {json_path}")
             return
         
         # Create the PowerPoint directly (bypass agent)
         print(f"\n🖼️  Creating PowerPoint presentation...")
-        confirmation = create_service_slides(slides_json, output_path)
+        with telemetry.span("pptx") as span:
+            confirmation = create_service_slides(slides_json, output_path)
+            if os.path.exists(output_path):
+                span["bytes_written"] = os.path.getsize(output_path)
         
         print(f"\n{confirmation}")
         print(f"📁 Saved to: {output_path}\n")
@@ -155,4 +268,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,6 +2,7 @@ import os
 import json
 from src.tools.pptx_creator_tool import execute_powerpoint_creation
 from service_crew import build_crew
+from src.telemetry import RunTelemetry, SPANS_SUFFIX
 
 def manual_powerpoint_creation(service_date: str):
     """
@@ -13,13 +14,15 @@ def manual_powerpoint_creation(service_date: str):
     theme = "Forgiveness"
     backgrounds_path = "backgrounds"
     output_dir = "output"
+    telemetry = RunTelemetry("manual_execution", service_date)
     
-    crew, theme_backgrounds_path, output_path = build_crew(
-        backgrounds_path=backgrounds_path,
-        output_dir=output_dir,
-        theme=theme,
-        service_date=service_date,
-    )
+    with telemetry.span("build_crew"):
+        crew, theme_backgrounds_path, output_path = build_crew(
+            backgrounds_path=backgrounds_path,
+            output_dir=output_dir,
+            theme=theme,
+            service_date=service_date,
+        )
     
     print(f"📁 Output path: {output_path}")
     print(f"🎨 Backgrounds path: {theme_backgrounds_path}")
@@ -28,32 +31,34 @@ def manual_powerpoint_creation(service_date: str):
     try:
         # Get the agents
         agents = crew.agents
-        planner, formatter, designer, creator = agents
+        planner, designer, creator = agents
         
-        # Execute tasks sequentially
+        # Execute tasks sequentially (long content is split into parts
+        # by execute_powerpoint_creation, not by an LLM)
         print("📋 Running Service Planner...")
-        plan_result = planner.execute_task(
-            crew.tasks[0],
-            context=None
-        )
-        
-        print("📝 Running Content Formatter...")
-        format_result = formatter.execute_task(
-            crew.tasks[1], 
-            context=[plan_result]
-        )
+        with telemetry.span("planner") as span:
+            plan_result = planner.execute_task(
+                crew.tasks[0],
+                context=None
+            )
+            span["retries"] = max(0, span.get("llm_calls", 1) - 1)
         
         print("🎨 Running Slide Designer...")
-        design_result = designer.execute_task(
-            crew.tasks[2],
-            context=[format_result]
-        )
+        with telemetry.span("designer") as span:
+            design_result = designer.execute_task(
+                crew.tasks[1],
+                context=[plan_result]
+            )
+            span["retries"] = max(0, span.get("llm_calls", 1) - 1)
         
         print("✅ Design task completed successfully!")
         
         # Now manually create the PowerPoint using the design result
         print("🔄 Starting manual PowerPoint creation...")
-        result = execute_powerpoint_creation(design_result, output_path, theme_backgrounds_path)
+        with telemetry.span("pptx") as span:
+            result = execute_powerpoint_creation(design_result, output_path, theme_backgrounds_path)
+            if os.path.exists(output_path):
+                span["bytes_written"] = os.path.getsize(output_path)
         
         print(f"\n{result}")
         return True
@@ -61,6 +66,9 @@ def manual_powerpoint_creation(service_date: str):
     except Exception as e:
         print(f"❌ Error during manual execution: {e}")
         return False
+    finally:
+        telemetry.write(output_path + SPANS_SUFFIX)
+        telemetry.print_summary()
 
 if __name__ == "__main__":
     import sys
@@ -1,8 +1,45 @@
 import os
-from crewai import Agent, Task, Crew, Process
+import json
+import re
+from crewai import Agent, Task, Crew, Process, LLM
 from src.tools.pptx_creator_tool import create_service_slides
+from src.llm_cache import LLMCache, CachedLLM, LLM_CACHE_PATH
+
+# Override to benchmark against another model or a local stand-in server
+# (see benchmarks/fake_llm_server.py)
+LLM_MODEL = os.environ.get("SLIDES_LLM_MODEL", "ollama/gemma3")
+LLM_BASE_URL = os.environ.get("SLIDES_LLM_BASE_URL")
+# Benchmarks point this at a throwaway file so canned answers never reach
+# the real cache
+LLM_CACHE_FILE = os.environ.get("SLIDES_LLM_CACHE_PATH", LLM_CACHE_PATH)
+
+# Sequential agent calls in a full build_crew() run (planner, designer, creator)
+CREW_LLM_CALLS = 3
+
+# Shared by every agent in the process so hits/misses are counted together
+_llm_cache = None
+
+
+def get_llm(use_cache: bool = True):
+    """
+    LLM for the agents; answers come from the on-disk cache when possible.
+    use_cache=False always queries the model (and refreshes the cache).
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache(LLM_CACHE_FILE)
+    extra = {"base_url": LLM_BASE_URL} if LLM_BASE_URL else {}
+    return CachedLLM(LLM_MODEL, _llm_cache, refresh=not use_cache, **extra)
+
+
+def llm_cache_summary():
+    return _llm_cache.summary() if _llm_cache else None
+
+
+def deck_output_path(output_dir: str, theme: str, service_date: str) -> str:
+    theme_sanitized = theme.strip().replace(" ", "")
+    return os.path.join(output_dir, f"{service_date}_{theme_sanitized}_ServiceSlides.pptx")
 
-LLM_MODEL = "ollama/gemma3"
 
 def select_background_folder(base_path: str, theme: str) -> str:
     theme_folder = theme.strip().lower().replace(" ", "_")
@@ -19,9 +56,46 @@ def select_background_folder(base_path: str, theme: str) -> str:
         return base_path
 
 
-def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date: str):
+def classify_items(items, known_types, use_cache=True):
+    """
+    Ask the LLM to turn free-form service order items (anything without a
+    recognised 'type') into slide items. All items go in one request.
+    Returns a list of {'type', 'title', 'content'} dicts, one per item;
+    anything the model gets wrong falls back to a plain text slide.
+    """
+    prompt = (
+        "Convert each of these church service order entries into a slide.\n"
+        f"Allowed types: {', '.join(sorted(known_types))}.\n"
+        "Return ONLY a JSON array with one object per entry, in the same order, "
+        "each with 'type', 'title' and 'content'. Use the text EXACTLY as given.\n\n"
+        f"{json.dumps(items, ensure_ascii=False, default=str)}"
+    )
+    response = get_llm(use_cache).call(prompt)
+
+    classified = []
+    try:
+        match = re.search(r'\[.*\]', str(response), re.DOTALL)
+        classified = json.loads(match.group()) if match else []
+    except json.JSONDecodeError:
+        print("⚠️ Could not parse LLM response, using text slides")
+
+    results = []
+    for i, item in enumerate(items):
+        slide = classified[i] if i < len(classified) and isinstance(classified[i], dict) else {}
+        if slide.get('type') not in known_types:
+            slide['type'] = 'text'
+        if not slide.get('title') and not slide.get('content'):
+            slide['title'] = item.get('title', '') if isinstance(item, dict) else ''
+            slide['content'] = item.get('content', '') if isinstance(item, dict) else str(item)
+        results.append(slide)
+    return results
+
+
+def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date: str,
+               use_cache: bool = True):
     """Create CrewAI workflow that converts the YAML service order into a PPTX."""
     theme_backgrounds_path = select_background_folder(backgrounds_path, theme)
+    llm = get_llm(use_cache)
 
     # === AGENTS ===
     planner = Agent(
@@ -30,16 +104,7 @@ def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date:
         backstory="Expert in organizing church service content and ensuring each element appears in presentation order.",
         verbose=True,
         allow_delegation=False,
-        llm=LLM_MODEL,
-    )
-
-    formatter = Agent(
-        role="Content Formatter",
-        goal="Split long content into multiple slides when it exceeds 6 lines. Add (Part 1), (Part 2) suffixes to titles.",
-        backstory="Specializes in making text fit presentation slides while preserving original content.",
-        verbose=True,
-        allow_delegation=False,
-        llm=LLM_MODEL,
+        llm=llm,
     )
 
     designer = Agent(
@@ -48,7 +113,7 @@ def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date:
         backstory="Expert at matching slide content with appropriate visual backgrounds.",
         verbose=True,
         allow_delegation=False,
-        llm=LLM_MODEL,
+        llm=llm,
     )
 
     creator = Agent(
@@ -57,7 +122,7 @@ def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date:
         backstory="Technical expert who executes tools with precise parameter formatting.",
         verbose=True,
         allow_delegation=False,
-        llm=LLM_MODEL,
+        llm=llm,
         tools=[create_service_slides]
     )
 
@@ -74,19 +139,6 @@ def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date:
         agent=planner,
     )
 
-    format_task = Task(
-        description=(
-            "Process the planner's JSON output and split any slide content exceeding 6 lines into multiple slides.\n"
-            "For split slides: add '(Part 1)', '(Part 2)' to the title.\n"
-            "Example: If 'Call to Worship' has 12 lines, create 'Call to Worship (Part 1)' and 'Call to Worship (Part 2)'.\n"
-            "PRESERVE original content - only split, don't edit or invent.\n"
-            "Return formatted JSON with same structure."
-        ),
-        expected_output="JSON array with split slides when needed: [{'type','title','content'}]",
-        agent=formatter,
-        context=[plan_task],
-    )
-
     design_task = Task(
         description=(
             f"CRITICAL: You MUST use FULL ABSOLUTE PATHS for background images.\n"
@@ -109,11 +161,10 @@ def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date:
         ),
         expected_output="Final JSON: [{'type','title','content','background_path'}] with FULL background paths",
         agent=designer,
-        context=[format_task],
+        context=[plan_task],
     )
 
-    theme_sanitized = theme.strip().replace(" ", "")
-    output_path = os.path.join(output_dir, f"{service_date}_{theme_sanitized}_ServiceSlides.pptx")
+    output_path = deck_output_path(output_dir, theme, service_date)
 
     pptx_task = Task(
         description=(
@@ -127,8 +178,8 @@ def build_crew(backgrounds_path: str, output_dir: str, theme: str, service_date:
     )
 
     crew = Crew(
-        agents=[planner, formatter, designer, creator],
-        tasks=[plan_task, format_task, design_task, pptx_task],
+        agents=[planner, designer, creator],
+        tasks=[plan_task, design_task, pptx_task],
         process=Process.sequential,
     )
 
@@ -0,0 +1,115 @@
+"""
+Per-stage timing and token spans for a conversion run.
+
+    telemetry = RunTelemetry("simple_convert", service_date)
+    with telemetry.span("load_yaml"):
+        ...
+    with telemetry.span("pptx") as span:
+        ...
+        span["bytes_written"] = os.path.getsize(output_path)
+    telemetry.write(output_path + SPANS_SUFFIX)
+    telemetry.print_summary()
+
+Spans are appended as JSON lines next to the deck, one line per stage,
+so successive runs can be compared. LLM calls made inside a span
+(through llm_cache.CachedLLM) add their token counts, call count and
+cache hits to it. Token counts are estimated from text length unless the
+stage reports real usage.
+"""
+
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+
+SPANS_SUFFIX = ".spans.jsonl"
+CHARS_PER_TOKEN = 4
+
+# Spans currently open, innermost last (LLM calls are charged to it)
+_active_spans = []
+
+
+def estimate_tokens(value):
+    """Rough token count of a prompt (string or message list) or response"""
+    if not isinstance(value, str):
+        value = json.dumps(value, default=str)
+    return len(value) // CHARS_PER_TOKEN
+
+
+def record_llm_call(prompt_tokens, completion_tokens, cached=False):
+    """Charge one LLM call to the innermost open span, if any"""
+    if not _active_spans:
+        return
+    span = _active_spans[-1]
+    span["llm_calls"] = span.get("llm_calls", 0) + 1
+    span["prompt_tokens"] = span.get("prompt_tokens", 0) + prompt_tokens
+    span["completion_tokens"] = span.get("completion_tokens", 0) + completion_tokens
+    if cached:
+        span["cache_hits"] = span.get("cache_hits", 0) + 1
+
+
+class RunTelemetry:
+    """Collects the spans of one run"""
+
+    def __init__(self, pipeline, service_date=None):
+        self.pipeline = pipeline
+        self.service_date = service_date
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = time.time()
+        self.spans = []
+
+    @contextmanager
+    def span(self, stage, **attributes):
+        """Time a stage; the yielded dict takes extra fields (bytes_written, retries, ...)"""
+        span = {"stage": stage, **attributes}
+        _active_spans.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+            span.setdefault("status", "ok")
+        except BaseException as e:
+            span["status"] = "error"
+            span["error"] = str(e)
+            raise
+        finally:
+            span["wall_s"] = round(time.perf_counter() - start, 6)
+            _active_spans.remove(span)
+            self.spans.append(span)
+
+    def add_span(self, stage, wall_s, **attributes):
+        """Record a stage timed elsewhere, e.g. work done in another process"""
+        span = {"stage": stage, **attributes, "wall_s": round(wall_s, 6)}
+        span.setdefault("status", "ok")
+        self.spans.append(span)
+        return span
+
+    def write(self, path):
+        """Append this run's spans to a JSON lines file"""
+        header = {"run_id": self.run_id, "pipeline": self.pipeline,
+                  "service_date": self.service_date, "started": round(self.started, 3)}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for span in self.spans:
+                f.write(json.dumps({**header, **span}, default=str) + "\n")
+        return path
+
+    def print_summary(self):
+        """Background spans overlap the others, so they are left out of the total"""
+        total = sum(span["wall_s"] for span in self.spans if not span.get("background"))
+        print(f"\n📊 Run summary ({self.pipeline}, {self.service_date})")
+        print(f"  {'stage':<24}{'wall':>10}{'share':>8}{'tokens in/out':>16}{'calls':>7}{'bytes':>12}")
+        for span in self.spans:
+            share = ""
+            if total and not span.get("background"):
+                share = f"{span['wall_s'] / total * 100:.0f}%"
+            tokens = ""
+            if "prompt_tokens" in span:
+                tokens = f"{span['prompt_tokens']}/{span['completion_tokens']}"
+            calls = str(span.get("llm_calls", ""))
+            written = f"{span['bytes_written']:,}" if "bytes_written" in span else ""
+            flag = " ❌" if span.get("status") == "error" else ""
+            if span.get("background"):
+                flag += " (background)"
+            print(f"  {span['stage']:<24}{span['wall_s']:>9.2f}s{share:>8}{tokens:>16}{calls:>7}{written:>12}{flag}")
+        print(f"  {'total':<24}{total:>9.2f}s")
@@ -0,0 +1,159 @@
+"""
+Background image index: one directory scan per run, O(1) lookups per slide.
+
+    index = BackgroundIndex("backgrounds", target_resolution="720p")
+    index.resolve("forgiveness", "prayer")   # backgrounds/forgiveness/variants/1280x720/prayer.jpg
+    index.resolve("easter", "offering")      # falls back to default/general if needed
+"""
+
+import os
+from src.tools.image_utils import parse_resolution, resolution_label
+
+# Slide type -> background image name (without extension)
+SLIDE_BACKGROUNDS = {
+    'countdown': 'countdown',
+    'song': 'song',
+    'hymn': 'hymn',
+    'prayer': 'prayer',
+    'scripture': 'scripture',
+    'sermon': 'sermon',
+    'communion': 'communion',
+    'offering': 'offering',
+    'children_message': 'children',
+    'liturgy': 'liturgy',
+    'text': 'general',
+    'dismissal': 'general',
+}
+
+DEFAULT_THEME = 'default'
+GENERAL_BACKGROUND = 'general'
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Subfolder of a theme holding resized copies (see generate_backgrounds.py --variants)
+VARIANTS_DIR = 'variants'
+
+
+def background_name(slide_type):
+    """Background image name used for a slide type"""
+    return SLIDE_BACKGROUNDS.get(slide_type, GENERAL_BACKGROUND)
+
+
+def _path_key(path):
+    """Normalise a path for comparison (absolute, OS case rules)"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+class BackgroundIndex:
+    """
+    Maps (theme, image name) to a background file.
+
+    The backgrounds folder is scanned once when the index is built; after
+    that every lookup is a dict access, with no per-slide stat calls.
+    When a target resolution is given, matching variants are preferred
+    over the full-size images.
+    """
+
+    def __init__(self, root="backgrounds", target_resolution=None):
+        self.root = root
+        self.target_size = parse_resolution(target_resolution) if target_resolution else None
+        self._images = {}      # (theme, name) -> path
+        self._by_path = {}     # normalised path -> (theme, name)
+        self._resolved = {}    # (theme, slide_type) -> path
+
+        if not os.path.isdir(root):
+            return
+
+        variant_label = resolution_label(self.target_size) if self.target_size else None
+
+        for theme_entry in os.scandir(root):
+            if not theme_entry.is_dir():
+                continue
+            theme = theme_entry.name
+            variants = {}
+            if variant_label:
+                variants = self._scan_images(os.path.join(theme_entry.path, VARIANTS_DIR, variant_label))
+
+            for name, path in self._scan_images(theme_entry.path).items():
+                self._by_path[_path_key(path)] = (theme, name)
+                self._images[(theme, name)] = variants.get(name, path)
+
+    @staticmethod
+    def _scan_images(folder):
+        """Return {name: path} for the image files directly inside folder"""
+        images = {}
+        try:
+            entries = sorted(os.scandir(folder), key=lambda entry: entry.name)
+        except OSError:
+            return images
+        for entry in entries:
+            name, ext = os.path.splitext(entry.name)
+            if ext.lower() in IMAGE_EXTENSIONS and entry.is_file() and name not in images:
+                images[name] = entry.path
+        return images
+
+    @property
+    def themes(self):
+        return sorted({theme for theme, _ in self._images})
+
+    def get(self, theme, name):
+        """Exact lookup of one theme image, or None"""
+        return self._images.get((theme, name))
+
+    def resolve(self, theme, slide_type):
+        """
+        Background for a slide type in a theme. Falls back, in order, to the
+        theme's general image, default/<type> and default/general.
+        Returns None if none of those exist.
+        """
+        key = (theme, slide_type)
+        if key not in self._resolved:
+            name = background_name(slide_type)
+            path = None
+            for candidate in ((theme, name), (theme, GENERAL_BACKGROUND),
+                              (DEFAULT_THEME, name), (DEFAULT_THEME, GENERAL_BACKGROUND)):
+                path = self._images.get(candidate)
+                if path:
+                    break
+            self._resolved[key] = path
+        return self._resolved[key]
+
+    def lookup(self, bg_path, slide_type, theme=None):
+        """
+        Resolve a slide's background_path (which may be a full path, a bare
+        filename, or empty) to an indexed file. Unknown paths fall back to
+        the slide type's background in the theme, then to default.
+        """
+        if bg_path:
+            hit = self._by_path.get(_path_key(bg_path))
+            if hit:
+                return self._images[hit]
+
+            # An explicit image outside the backgrounds folder
+            if os.path.isfile(bg_path):
+                return bg_path
+
+            name = os.path.splitext(os.path.basename(bg_path.replace("\\", "/")))[0]
+            parent = os.path.basename(os.path.dirname(bg_path.replace("\\", "/")))
+            for candidate_theme in (parent, theme):
+                if candidate_theme and (candidate_theme, name) in self._images:
+                    return self._images[(candidate_theme, name)]
+
+        return self.resolve(theme or DEFAULT_THEME, slide_type)
+
+    def report_missing(self, theme, slide_types):
+        """
+        Print, once and up front, which slide types have no image of their
+        own in the theme and what they fall back to. Returns the misses.
+        """
+        misses = {}
+        for slide_type in sorted(set(slide_types)):
+            name = background_name(slide_type)
+            if (theme, name) not in self._images:
+                misses[slide_type] = self.resolve(theme, slide_type)
+
+        for slide_type, fallback in misses.items():
+            if fallback:
+                print(f"⚠️ No {background_name(slide_type)} background in '{theme}' for {slide_type} slides, using {fallback}")
+            else:
+                print(f"❌ No background available for {slide_type} slides (theme '{theme}')")
+        return misses
@@ -0,0 +1,156 @@
+"""
+Streaming reader for Word (.docx) documents.
+
+Reads word/document.xml straight from the zip with iterparse and yields
+one DocxParagraph per paragraph, with its style and run formatting, while
+discarding finished elements so memory stays flat however long the
+document is. Nothing outside the standard library is needed.
+
+    for paragraph in iter_paragraphs("bulletin.docx"):
+        if paragraph.is_heading or paragraph.bold:
+            ...
+"""
+
+import zipfile
+import xml.etree.ElementTree as ET
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_P = W_NS + "p"
+W_R = W_NS + "r"
+W_T = W_NS + "t"
+W_VAL = W_NS + "val"
+
+# Toggle properties count as on unless explicitly switched off
+FALSE_VALUES = ("0", "false", "off", "none")
+
+# Max words for a fully bold paragraph to count as a header
+BOLD_HEADER_MAX_WORDS = 8
+
+
+class DocxParagraph:
+    """One paragraph of a Word document"""
+
+    __slots__ = ("text", "style", "bold", "italic", "list_level", "in_table")
+
+    def __init__(self, text, style=None, bold=False, italic=False, list_level=None, in_table=False):
+        self.text = text
+        self.style = style            # style name, e.g. "Heading 2" (None for Normal)
+        self.bold = bold              # every visible character is bold
+        self.italic = italic
+        self.list_level = list_level  # 0-based numbering level, None if not a list item
+        self.in_table = in_table
+
+    @property
+    def is_heading(self):
+        style = (self.style or "").lower()
+        return style.startswith("heading") or style in ("title", "subtitle")
+
+    @property
+    def looks_like_header(self):
+        """Formatted as a header: a heading style, or a short fully bold line"""
+        text = self.text.strip()
+        if not text:
+            return False
+        return self.is_heading or (self.bold and len(text.split()) <= BOLD_HEADER_MAX_WORDS)
+
+    def __repr__(self):
+        return f"DocxParagraph({self.text!r}, style={self.style!r}, bold={self.bold})"
+
+
+def _flag(properties, tag):
+    """State of an on/off run or style property such as w:b"""
+    if properties is None:
+        return None
+    element = properties.find(W_NS + tag)
+    if element is None:
+        return None
+    return element.get(W_VAL, "true").lower() not in FALSE_VALUES
+
+
+def load_styles(docx):
+    """{style id: (style name, bold)} from word/styles.xml (small, read whole)"""
+    styles = {}
+    try:
+        root = ET.fromstring(docx.read("word/styles.xml"))
+    except KeyError:
+        return styles
+    for style in root.iter(W_NS + "style"):
+        style_id = style.get(W_NS + "styleId")
+        name = style.find(W_NS + "name")
+        styles[style_id] = (
+            name.get(W_VAL) if name is not None else style_id,
+            bool(_flag(style.find(W_NS + "rPr"), "b")),
+        )
+    return styles
+
+
+def _read_paragraph(p, styles, in_table):
+    properties = p.find(W_NS + "pPr")
+    style_name, style_bold = None, False
+    list_level = None
+    if properties is not None:
+        style = properties.find(W_NS + "pStyle")
+        if style is not None:
+            style_name, style_bold = styles.get(style.get(W_VAL), (style.get(W_VAL), False))
+        numbering = properties.find(W_NS + "numPr")
+        if numbering is not None:
+            level = numbering.find(W_NS + "ilvl")
+            list_level = int(level.get(W_VAL, 0)) if level is not None else 0
+
+    parts = []
+    bold = italic = True
+    has_text = False
+    for run in p.iter(W_R):
+        run_properties = run.find(W_NS + "rPr")
+        run_text = []
+        for child in run:
+            if child.tag == W_T:
+                run_text.append(child.text or "")
+            elif child.tag == W_NS + "tab":
+                run_text.append("\t")
+            elif child.tag in (W_NS + "br", W_NS + "cr"):
+                run_text.append("\n")
+        text = "".join(run_text)
+        parts.append(text)
+        if text.strip():
+            has_text = True
+            run_bold = _flag(run_properties, "b")
+            bold = bold and (style_bold if run_bold is None else run_bold)
+            italic = italic and bool(_flag(run_properties, "i"))
+
+    return DocxParagraph("".join(parts), style_name, has_text and bold, has_text and italic,
+                         list_level, in_table)
+
+
+def iter_paragraphs(docx_path):
+    """Yield the document's paragraphs in order, including those in tables"""
+    with zipfile.ZipFile(docx_path) as docx:
+        styles = load_styles(docx)
+        with docx.open("word/document.xml") as xml_file:
+            body = None
+            depth = 0
+            table_depth = 0
+            for event, element in ET.iterparse(xml_file, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if element.tag == W_BODY:
+                        body = element
+                    elif element.tag == W_NS + "tbl":
+                        table_depth += 1
+                    continue
+
+                depth -= 1
+                if element.tag == W_P:
+                    yield _read_paragraph(element, styles, table_depth > 0)
+                    element.clear()
+                elif element.tag == W_NS + "tbl":
+                    table_depth -= 1
+                # Drop finished top-level blocks (document > body > block)
+                if depth == 2 and body is not None:
+                    body.clear()
+
+
+def read_docx_text(docx_path):
+    """Plain text of a document, one paragraph per line"""
+    return "\n".join(paragraph.text for paragraph in iter_paragraphs(docx_path))
@@ -1,9 +1,17 @@
 import os
 import sys
-from PIL import Image, ImageDraw, ImageFont
+import json
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageDraw, ImageFont, ImageOps
 import argparse
 import re
 
+try:
+    from src.tools.image_utils import vertical_gradient, parse_resolution, resolution_label
+except ImportError:
+    # Running as a script from src/tools
+    from image_utils import vertical_gradient, parse_resolution, resolution_label
+
 
 def parse_color_pair(pair_str):
     """Parse a string like '(0,120,200),(0,60,130)' into two RGB tuples."""
@@ -15,38 +23,52 @@ def parse_color_pair(pair_str):
     return top, bottom
 
 
-def create_slide_image(text, color_top, color_bottom, save_path, opacity=130, radius=30):
-    width, height = 1920, 1080
-    img = Image.new("RGB", (width, height), color_top)
-    draw = ImageDraw.Draw(img)
+BACKGROUND_SIZE = (1920, 1080)
+# Bump when the gradient, panel or text drawing changes so existing
+# backgrounds are re-rendered instead of reported as unchanged
+RENDER_VERSION = 1
+SLIDE_JPEG_QUALITY = 75
+MANIFEST_NAME = ".manifest.json"
+VARIANTS_DIR = "variants"
+DEFAULT_VARIANTS = ["1280x720", "1920x1080"]
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
 
-    # Gradient background
-    for i in range(height):
-        ratio = i / height
-        r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
-        g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
-        b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
-        draw.line([(0, i), (width, i)], fill=(r, g, b))
+FONT_PATHS = [
+    "/System/Library/Fonts/Supplemental/Arial.ttf",  # Mac
+    "/Library/Fonts/Arial.ttf",  # Mac alternative
+    "arial.ttf",  # Windows
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+]
 
-    # Load font - try multiple common font locations
-    font = None
-    font_paths = [
-        "/System/Library/Fonts/Supplemental/Arial.ttf",  # Mac
-        "/Library/Fonts/Arial.ttf",  # Mac alternative
-        "arial.ttf",  # Windows
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-    ]
-    
-    for font_path in font_paths:
+
+def find_font_path():
+    """Return the first font in FONT_PATHS that loads, or None."""
+    for font_path in FONT_PATHS:
         try:
-            font = ImageFont.truetype(font_path, 80)
-            break
+            ImageFont.truetype(font_path, 80)
+            return font_path
         except:
             continue
-    
-    if font is None:
+    return None
+
+
+def create_slide_image(text, color_top, color_bottom, save_path, opacity=130, radius=30,
+                       font_path=None, size=BACKGROUND_SIZE, quality=SLIDE_JPEG_QUALITY):
+    width, height = size
+
+    # Gradient background
+    img = vertical_gradient(width, height, color_top, color_bottom)
+    draw = ImageDraw.Draw(img)
+
+    # Load font - try multiple common font locations
+    if font_path is None:
+        font_path = find_font_path()
+
+    if font_path is None:
         print("⚠️ Using default font (Arial not found)")
         font = ImageFont.load_default()
+    else:
+        font = ImageFont.truetype(font_path, 80)
 
     # Text size
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -75,11 +97,115 @@ def create_slide_image(text, color_top, color_bottom, save_path, opacity=130, ra
     draw_rgba.text((x, y), text, fill=(255, 255, 255, 255), font=font)
 
     img_rgb = img_rgba.convert("RGB")
-    img_rgb.save(save_path, "JPEG")
+    img_rgb.save(save_path, "JPEG", quality=quality)
+    print(f"✅ Created {save_path}")
+
+
+def _create_slide_image_job(job):
+    """Process pool entry point for create_slide_image"""
+    create_slide_image(*job)
+
+
+def load_manifest(manifest_path):
+    """Load a theme's manifest of recipes, keyed by slide name."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest_path, manifest):
+    """Write the manifest atomically so an interrupted run can't corrupt it."""
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def create_variant(source_path, save_path, size, quality=85):
+    """Write a resized, progressive, metadata-free JPEG copy of a background."""
+    with Image.open(source_path) as img:
+        img = img.convert("RGB")
+        if img.size != tuple(size):
+            # Crop to the target aspect ratio rather than distorting the image
+            img = ImageOps.fit(img, size, Image.Resampling.LANCZOS)
+        # No exif/icc_profile is passed, so camera and editor metadata is dropped
+        img.save(save_path, "JPEG", quality=quality, optimize=True, progressive=True)
     print(f"✅ Created {save_path}")
 
 
-def generate_backgrounds(theme_name, color_map, opacity, radius):
+def _create_variant_job(job):
+    """Process pool entry point for create_variant"""
+    create_variant(*job)
+
+
+def generate_variants(theme_name, resolutions, quality=85, workers=None, force=False):
+    """
+    Build reduced-size copies of every background in a theme folder.
+
+    Variants are written to backgrounds/<theme>/variants/<WxH>/<name>.jpg.
+    Like the main images they are tracked in the theme manifest and only
+    rebuilt when the source image, size or quality changes. Works for any
+    theme, including ones whose images weren't made by this script.
+    """
+    folder = os.path.join(os.getcwd(), "backgrounds", theme_name)
+    if not os.path.isdir(folder):
+        print(f"❌ Theme folder not found: {folder}")
+        return
+
+    manifest_path = os.path.join(folder, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+
+    sources = sorted(
+        entry for entry in os.listdir(folder)
+        if entry.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+    jobs = []
+    for size in resolutions:
+        label = resolution_label(size)
+        variant_folder = os.path.join(folder, VARIANTS_DIR, label)
+        os.makedirs(variant_folder, exist_ok=True)
+        for source in sources:
+            source_path = os.path.join(folder, source)
+            stat = os.stat(source_path)
+            name = os.path.splitext(source)[0]
+            save_path = os.path.join(variant_folder, f"{name}.jpg")
+            key = f"{VARIANTS_DIR}/{label}/{name}.jpg"
+            recipe = {
+                "source": source,
+                "source_size": stat.st_size,
+                "source_mtime": stat.st_mtime_ns,
+                "resolution": list(size),
+                "quality": quality,
+            }
+            if not force and manifest.get(key) == recipe and os.path.exists(save_path):
+                continue
+            manifest[key] = recipe
+            jobs.append((source_path, save_path, size, quality))
+
+    total = len(sources) * len(resolutions)
+    if not jobs:
+        print(f"✅ All {total} variants in {folder} are up to date")
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        for job in jobs:
+            create_variant(*job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_create_variant_job, jobs))
+
+    save_manifest(manifest_path, manifest)
+    print(f"✅ Rendered {len(jobs)} of {total} variants in {folder}")
+
+
+def generate_backgrounds(theme_name, color_map, opacity, radius, workers=None, force=False):
     # Use relative path from current directory
     base = os.path.join(os.getcwd(), "backgrounds")
     folder = os.path.join(base, theme_name)
@@ -101,10 +227,49 @@ def generate_backgrounds(theme_name, color_map, opacity, radius):
             "general": ((100, 130, 160), (40, 60, 80)),
         }
 
+    font_path = find_font_path()
+    manifest_path = os.path.join(folder, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+
+    # Only re-render images whose recipe changed (or whose file is missing)
+    jobs = []
     for name, (top, bottom) in color_map.items():
-        text = name.capitalize()
+        recipe = {
+            "render_version": RENDER_VERSION,
+            "text": name.capitalize(),
+            "colors": [list(top), list(bottom)],
+            "opacity": opacity,
+            "radius": radius,
+            "font": font_path,
+            "resolution": list(BACKGROUND_SIZE),
+            "quality": SLIDE_JPEG_QUALITY,
+        }
         save_path = os.path.join(folder, f"{name}.jpg")
-        create_slide_image(text, top, bottom, save_path, opacity, radius)
+        if not force and manifest.get(name) == recipe and os.path.exists(save_path):
+            print(f"⏭️  Unchanged {save_path}")
+            continue
+        manifest[name] = recipe
+        jobs.append((recipe["text"], top, bottom, save_path, opacity, radius, font_path,
+                     BACKGROUND_SIZE, SLIDE_JPEG_QUALITY))
+
+    if not jobs:
+        print(f"✅ All backgrounds in {folder} are up to date")
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        for job in jobs:
+            create_slide_image(*job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # list() re-raises the first worker error, if any
+            list(pool.map(_create_slide_image_job, jobs))
+
+    save_manifest(manifest_path, manifest)
+    print(f"✅ Rendered {len(jobs)} of {len(color_map)} backgrounds in {folder}")
 
 
 if __name__ == "__main__":
@@ -119,6 +284,17 @@ if __name__ == "__main__":
     )
     parser.add_argument("--opacity", type=int, default=130, help="Box opacity (0-255)")
     parser.add_argument("--radius", type=int, default=30, help="Corner radius of box")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes used to render images (default: one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every image even if its recipe is unchanged")
+    parser.add_argument("--variants", nargs="*", default=None,
+                        help="Also write resized variants, e.g. --variants 1280x720 1920x1080 "
+                             "(bare --variants: " + " and ".join(DEFAULT_VARIANTS) + ")")
+    parser.add_argument("--quality", type=int, default=85,
+                        help="JPEG quality for variants (default: 85)")
+    parser.add_argument("--variants-only", action="store_true",
+                        help="Only build variants from the images already in the theme folder")
 
     args = parser.parse_args()
 
@@ -134,4 +310,16 @@ if __name__ == "__main__":
             except ValueError as e:
                 print(f"❌ Error parsing {name}: {e}")
 
-    generate_backgrounds(args.theme, color_map, args.opacity, args.radius)
\ No newline at end of file
+    if not args.variants_only:
+        generate_backgrounds(args.theme, color_map, args.opacity, args.radius,
+                             workers=args.workers, force=args.force)
+
+    # A bare --variants gives [], which means the standard sizes
+    if args.variants is not None or args.variants_only:
+        try:
+            resolutions = [parse_resolution(v) for v in (args.variants or DEFAULT_VARIANTS)]
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        generate_variants(args.theme, resolutions, args.quality,
+                          workers=args.workers, force=args.force)
\ No newline at end of file
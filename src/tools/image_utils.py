@@ -0,0 +1,45 @@
+"""
+Shared image helpers for slide backgrounds and countdown frames
+"""
+
+from PIL import Image
+
+
+def vertical_gradient(width, height, color_top, color_bottom):
+    """
+    Build a top-to-bottom RGB gradient without a per-row Python loop.
+
+    Pillow's 256-step linear_gradient ramp is resized to a 1-pixel column
+    and used as the mask for compositing the two end colors; the column
+    is then stretched across the full width. All of it runs in C. Rows
+    can differ from the old per-row draw.line loop by a couple of levels
+    per channel (the mask is 8-bit), which is not visible.
+    """
+    top = Image.new("RGB", (1, height), tuple(color_top[:3]))
+    bottom = Image.new("RGB", (1, height), tuple(color_bottom[:3]))
+    mask = Image.linear_gradient("L").resize((1, height), Image.Resampling.BILINEAR)
+    strip = Image.composite(bottom, top, mask)
+    return strip.resize((width, height), Image.Resampling.NEAREST)
+
+
+# Short names accepted wherever a target resolution is given
+RESOLUTION_ALIASES = {
+    "720p": "1280x720",
+    "1080p": "1920x1080",
+    "4k": "3840x2160",
+}
+
+
+def parse_resolution(value):
+    """Parse '1280x720' or an alias like '720p' into a (width, height) tuple."""
+    text = RESOLUTION_ALIASES.get(str(value).strip().lower(), str(value).strip().lower())
+    try:
+        width, height = (int(part) for part in text.split("x"))
+    except ValueError:
+        raise ValueError(f"Invalid resolution: {value!r} (expected e.g. 1280x720 or 720p)")
+    return width, height
+
+
+def resolution_label(size):
+    """Folder name used for a resolution variant, e.g. '1280x720'."""
+    return f"{size[0]}x{size[1]}"
@@ -0,0 +1,392 @@
+"""
+PowerPoint deck builder used by both the direct conversion scripts and
+the CrewAI pipeline. Kept free of agent-framework imports so
+simple_convert.py starts quickly; the CrewAI @tool wrapper lives in
+pptx_creator_tool.py.
+"""
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import Future
+from src.tools.background_index import BackgroundIndex
+from src.tools.slide_splitter import (
+    split_slides, CONTENT_WIDTH_IN, CONTENT_HEIGHT_IN, TEXT_MARGIN_IN, TITLE_PT, SPACER_PT, CONTENT_PT
+)
+
+# Bump when the slide layout code below changes, so previously built slides
+# are not reused with an outdated look
+SLIDE_LAYOUT_VERSION = 1
+SIDECAR_SUFFIX = ".slides.json"
+
+def _file_stamp(path):
+    """Cheap content stamp for a file: [mtime_ns, size], or None if missing"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def slide_fingerprint(index, slide_info, resolved_background):
+    """Digest of everything that goes into one generated slide"""
+    slide_type = slide_info.get("type", "")
+    recipe = {
+        "layout": SLIDE_LAYOUT_VERSION,
+        "type": slide_type,
+        "title": str(slide_info.get("title", f"Slide {index+1}")),
+        "content": str(slide_info.get("content", "")),
+        "background": [resolved_background, _file_stamp(resolved_background)],
+    }
+    if index == 0 and slide_type == 'countdown':
+        video = slide_info.get('countdown_video') or 'output/countdown.mp4'
+        recipe["video"] = [video, _file_stamp(video)]
+    return hashlib.sha256(json.dumps(recipe, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _load_previous_deck(output_path):
+    """
+    Open the deck from the last build with its per-slide fingerprints, or
+    return (None, []) if it is missing, was edited since, or doesn't match.
+    """
+    try:
+        with open(output_path + SIDECAR_SUFFIX, "r", encoding="utf-8") as f:
+            sidecar = json.load(f)
+        if sidecar.get("layout") != SLIDE_LAYOUT_VERSION or sidecar.get("deck") != _file_stamp(output_path):
+            return None, []
+        prs = Presentation(output_path)
+    except Exception:
+        return None, []
+    
+    fingerprints = sidecar.get("slides", [])
+    if len(prs.slides) != len(fingerprints):
+        return None, []
+    return prs, fingerprints
+
+def _save_sidecar(output_path, fingerprints):
+    """Record slide fingerprints next to the deck for the next rebuild"""
+    sidecar_path = output_path + SIDECAR_SUFFIX
+    tmp_path = sidecar_path + ".partial"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"layout": SLIDE_LAYOUT_VERSION, "deck": _file_stamp(output_path),
+                   "slides": fingerprints}, f)
+    os.replace(tmp_path, sidecar_path)
+
+def create_powerpoint_manual(slides_data, output_path, theme_backgrounds_path=None,
+                             target_resolution=None, background_index=None, incremental=True,
+                             countdown_video=None):
+    """
+    Manual function to create PowerPoint - call this directly from your code
+    Now with automatic countdown video embedding!
+    
+    target_resolution (e.g. "1280x720" or "720p") embeds the matching
+    background variant where one exists, for smaller, faster decks.
+    background_index lets callers building several decks share one
+    BackgroundIndex instead of rescanning the backgrounds folder.
+    
+    With incremental=True, slides whose fingerprint matches the previous
+    build (recorded in <output>.slides.json) are kept from the existing
+    deck and only changed slides are regenerated.
+    
+    countdown_video may be a concurrent.futures.Future that resolves to the
+    video path. The countdown slide is then built last, once the video is
+    ready, so rendering overlaps with building the rest of the deck.
+    """
+    print("🚀 Manual PowerPoint Creation Started")
+    print(f"📝 Output path: {output_path}")
+    print(f"🎨 Backgrounds path: {theme_backgrounds_path}")
+    
+    # Backgrounds are resolved through an index built from one folder scan
+    theme = None
+    backgrounds_root = "backgrounds"
+    if theme_backgrounds_path:
+        parent, theme = os.path.split(os.path.normpath(theme_backgrounds_path))
+        backgrounds_root = parent or backgrounds_root
+    
+    if background_index is None:
+        try:
+            background_index = BackgroundIndex(backgrounds_root, target_resolution)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return f"Error: {e}"
+    if background_index.target_size:
+        print(f"📐 Target resolution: {background_index.target_size[0]}x{background_index.target_size[1]}")
+    
+    # Handle input data
+    if isinstance(slides_data, str):
+        try:
+            slides_data = json.loads(slides_data)
+        except:
+            print("❌ Could not parse slides_data as JSON")
+            return f"Error: Invalid slides_data format"
+    
+    if not isinstance(slides_data, list):
+        print(f"❌ slides_data must be a list, got {type(slides_data)}")
+        return f"Error: slides_data must be a list"
+    
+    print(f"📊 Processing {len(slides_data)} slides...")
+    
+    background_index.report_missing(
+        theme or "default",
+        [slide.get("type", "") for slide in slides_data if isinstance(slide, dict)]
+    )
+    
+    # Start from the previous deck when rebuilding, so unchanged slides
+    # (and their images) can be carried over as-is
+    prs, previous_fingerprints = _load_previous_deck(output_path) if incremental else (None, [])
+    reusable = {}
+    if prs is not None:
+        for slide_id, fingerprint in zip(list(prs.slides._sldIdLst), previous_fingerprints):
+            reusable.setdefault(fingerprint, []).append(slide_id)
+    else:
+        prs = Presentation()
+    slide_width = prs.slide_width
+    slide_height = prs.slide_height
+    
+    successful_slides = 0
+    reused_slides = 0
+    built = {}            # slide index -> (sldId element, fingerprint)
+    
+    # A countdown still rendering in the background is embedded last
+    build_order = list(range(len(slides_data)))
+    pending_video = countdown_video if isinstance(countdown_video, Future) else None
+    if pending_video and build_order and isinstance(slides_data[0], dict) \
+            and slides_data[0].get("type") == 'countdown':
+        build_order = build_order[1:] + [0]
+    
+    for i in build_order:
+        slide_info = slides_data[i]
+        if not isinstance(slide_info, dict):
+            print(f"⚠️ Slide {i+1} is not a dictionary, skipping")
+            continue
+        
+        if i == 0 and pending_video:
+            print(f"⏳ Waiting for countdown video...")
+            wait_start = time.perf_counter()
+            try:
+                video_path = pending_video.result()
+            except Exception as e:
+                print(f"⚠️ Countdown video failed: {e}")
+                video_path = None
+            print(f"   Waited {time.perf_counter() - wait_start:.1f}s")
+            if video_path:
+                slide_info = {**slide_info, 'countdown_video': video_path}
+        
+        title = slide_info.get("title", f"Slide {i+1}")
+        bg_path = slide_info.get("background_path", "")
+        slide_type = slide_info.get("type", "")
+        resolved_path = background_index.lookup(bg_path, slide_type, theme)
+        fingerprint = slide_fingerprint(i, slide_info, resolved_path)
+        
+        if reusable.get(fingerprint):
+            built[i] = (reusable[fingerprint].pop(0), fingerprint)
+            successful_slides += 1
+            reused_slides += 1
+            continue
+            
+        slide_count = len(prs.slides._sldIdLst)
+        try:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            
+            print(f"🖼️ Slide {i+1}: '{title}' - Background path: {bg_path}")
+            
+            # --- Enhanced Background image handling ---
+            background_used = False
+            
+            if resolved_path:
+                try:
+                    slide.shapes.add_picture(resolved_path, 0, 0, width=slide_width, height=slide_height)
+                    print(f"✅ Slide {i+1}: '{title}' - Background FOUND: {resolved_path}")
+                    background_used = True
+                except Exception as e:
+                    print(f"⚠️ Slide {i+1}: Error loading background {resolved_path}: {e}")
+            else:
+                print(f"❌ Slide {i+1}: '{title}' - No background found for '{bg_path or slide_type}'")
+            
+            # Fallback background
+            if not background_used:
+                print(f"🎨 Slide {i+1}: Using fallback blue background")
+                background = slide.background
+                fill = background.fill
+                fill.solid()
+                fill.fore_color.rgb = RGBColor(0, 32, 96)
+            
+            # --- AUTO-EMBED COUNTDOWN VIDEO ON FIRST SLIDE ---
+            if i == 0 and slide_type == 'countdown':
+                # Look for countdown video
+                countdown_video_path = slide_info.get('countdown_video')
+                
+                if not countdown_video_path:
+                    # Check default location
+                    countdown_video_path = 'output/countdown.mp4'
+                
+                if countdown_video_path and os.path.exists(countdown_video_path):
+                    try:
+                        # Embed video in the center of the slide
+                        video_width = Inches(10)
+                        video_height = Inches(5.625)  # 16:9 aspect ratio
+                        video_left = (slide_width - video_width) / 2
+                        video_top = (slide_height - video_height) / 2
+                        
+                        # Add video to slide
+                        movie = slide.shapes.add_movie(
+                            countdown_video_path,
+                            video_left, video_top,
+                            video_width, video_height
+                        )
+                        
+                        print(f"🎬 Slide {i+1}: Countdown video EMBEDDED from {countdown_video_path}")
+                        print(f"   ⚠️ Note: Video will need to be set to auto-play in PowerPoint")
+                        
+                    except Exception as e:
+                        print(f"⚠️ Slide {i+1}: Could not embed video: {e}")
+                        print(f"   You can manually insert: {countdown_video_path}")
+                else:
+                    print(f"⚠️ Slide {i+1}: Countdown video not found at {countdown_video_path}")
+            
+            # --- Text content area ---
+            content_width = Inches(CONTENT_WIDTH_IN)
+            content_height = Inches(CONTENT_HEIGHT_IN)
+            content_left = (slide_width - content_width) / 2
+            content_top = (slide_height - content_height) / 2
+            
+            # Only add text content if there's content or it's not a countdown slide
+            content = slide_info.get("content", "")
+            if content or slide_type != 'countdown':
+                # Translucent background for text
+                rect = slide.shapes.add_shape(
+                    MSO_SHAPE.ROUNDED_RECTANGLE,
+                    content_left, content_top, content_width, content_height
+                )
+                fill = rect.fill
+                fill.solid()
+                fill.fore_color.rgb = RGBColor(0, 0, 0)
+                fill.transparency = 0.3
+                rect.line.fill.background()
+                
+                # Text box
+                text_margin = Inches(TEXT_MARGIN_IN)
+                textbox = slide.shapes.add_textbox(
+                    content_left + text_margin,
+                    content_top + text_margin,
+                    content_width - (text_margin * 2),
+                    content_height - (text_margin * 2)
+                )
+                text_frame = textbox.text_frame
+                text_frame.word_wrap = True
+                text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+                
+                # Title
+                p_title = text_frame.add_paragraph()
+                p_title.text = str(title)
+                p_title.font.bold = True
+                p_title.font.size = Pt(TITLE_PT)
+                p_title.font.color.rgb = RGBColor(255, 255, 255)
+                p_title.alignment = PP_ALIGN.CENTER
+                
+                # Content
+                if content:
+                    # Add spacing after title
+                    p_spacing = text_frame.add_paragraph()
+                    p_spacing.text = ""
+                    p_spacing.font.size = Pt(SPACER_PT)
+                    
+                    # Process content lines
+                    content_lines = str(content).split("\n")
+                    for line in content_lines:
+                        if line.strip():
+                            p = text_frame.add_paragraph()
+                            p.text = line.strip()
+                            p.font.size = Pt(CONTENT_PT)
+                            p.font.color.rgb = RGBColor(240, 240, 240)
+                            p.alignment = PP_ALIGN.CENTER
+            
+            built[i] = (prs.slides._sldIdLst[-1], fingerprint)
+            successful_slides += 1
+            print(f"✅ Successfully created slide {i+1}: {title}")
+            
+        except Exception as e:
+            print(f"❌ Error creating slide {i+1}: {e}")
+            import traceback
+            traceback.print_exc()
+            # Keep the partial slide as before, but never reuse it
+            if len(prs.slides._sldIdLst) > slide_count:
+                built[i] = (prs.slides._sldIdLst[-1], None)
+            continue
+    
+    # Put slides in order and drop the old ones that are no longer used
+    slide_order = [built[i][0] for i in sorted(built)]
+    fingerprints = [built[i][1] for i in sorted(built)]
+    slide_id_list = prs.slides._sldIdLst
+    stale = [slide_id for slide_id in slide_id_list if slide_id not in slide_order]
+    for slide_id in list(slide_id_list):
+        slide_id_list.remove(slide_id)
+    for slide_id in slide_order:
+        slide_id_list.append(slide_id)
+    for slide_id in stale:
+        prs.part.drop_rel(slide_id.rId)
+    
+    if reused_slides:
+        print(f"♻️ Reused {reused_slides} unchanged slides, regenerated {successful_slides - reused_slides}")
+    
+    # Save the presentation
+    try:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        tmp_path = output_path + ".partial"
+        prs.save(tmp_path)
+        os.replace(tmp_path, output_path)
+        _save_sidecar(output_path, fingerprints)
+        print(f"💾 Successfully saved PowerPoint with {successful_slides} slides to: {output_path}")
+        return f"✅ PowerPoint created successfully with {successful_slides} slides: {output_path}"
+    except Exception as e:
+        error_msg = f"❌ Error saving PowerPoint: {e}"
+        print(error_msg)
+        return error_msg
+
+def execute_powerpoint_creation(design_task_output, output_path, theme_backgrounds_path):
+    """
+    Execute PowerPoint creation directly using the design task output
+    """
+    print("🎯 Direct PowerPoint Execution")
+    print(f"🎨 Using backgrounds from: {theme_backgrounds_path}")
+    
+    slides_data = None
+    
+    if hasattr(design_task_output, 'raw'):
+        raw_output = design_task_output.raw
+        if isinstance(raw_output, str):
+            try:
+                slides_data = json.loads(raw_output)
+            except:
+                import re
+                json_match = re.search(r'\[.*\]', raw_output, re.DOTALL)
+                if json_match:
+                    try:
+                        slides_data = json.loads(json_match.group())
+                    except:
+                        pass
+        elif isinstance(raw_output, list):
+            slides_data = raw_output
+    
+    if not slides_data:
+        print("❌ Could not extract slides data from design task output")
+        return False
+    
+    print(f"📊 Found {len(slides_data)} slides in design output")
+    
+    # Splitting is done here rather than by an LLM formatter agent
+    slides_data = split_slides(slides_data)
+    
+    for slide in slides_data:
+        if 'background_path' in slide:
+            bg_path = slide['background_path']
+            if bg_path and '/' not in bg_path and '\\' not in bg_path:
+                new_path = os.path.join(theme_backgrounds_path, bg_path)
+                print(f"🔄 Fixed background path: '{bg_path}' -> '{new_path}'")
+                slide['background_path'] = new_path
+    
+    return create_powerpoint_manual(slides_data, output_path, theme_backgrounds_path)
@@ -0,0 +1,70 @@
+"""
+Rule-based mapping from service order YAML items to slide dicts.
+
+Items with a recognised type (see SLIDE_BACKGROUNDS) are converted
+without any LLM involvement; src/main.py --hybrid only sends the rest
+to a model.
+"""
+
+import os
+from src.tools.background_index import SLIDE_BACKGROUNDS, background_name
+
+KNOWN_TYPES = frozenset(SLIDE_BACKGROUNDS)
+
+
+def is_structured(item):
+    """True if an order item can be converted by rule"""
+    return isinstance(item, dict) and item.get('type') in KNOWN_TYPES
+
+
+def item_to_slide(item, backgrounds_path):
+    """Convert one service order item to a slide dict"""
+    slide_type = item.get('type', 'text')
+    title = item.get('title', '')
+
+    # Get content - could be 'content' or 'reference' for scripture
+    content = item.get('content', '')
+    if not content and 'reference' in item:
+        content = item.get('reference', '')
+
+    # Special handling for SERMON slides
+    if slide_type == 'sermon':
+        # Build sermon slide content
+        sermon_parts = []
+
+        # Add the sermon title
+        if title:
+            sermon_parts.append(title)
+
+        # Add speaker information
+        if 'speaker' in item:
+            sermon_parts.append("")  # Blank line
+            sermon_parts.append(item['speaker'])
+        elif 'presenter' in item:
+            sermon_parts.append("")  # Blank line
+            sermon_parts.append(item['presenter'])
+
+        # Combine into content
+        content = '\n'.join(sermon_parts)
+
+        # Use "Sermon" as the title for the slide (displays at top)
+        title = "Sermon"
+
+    # Handle other slide types with speaker/presenter info
+    elif 'speaker' in item or 'presenter' in item:
+        presenter_name = item.get('speaker') or item.get('presenter')
+
+        if content:
+            content += f"\n\n{presenter_name}"
+        else:
+            content = presenter_name
+
+    # Map slide type to background
+    bg_path = os.path.join(backgrounds_path, f"{background_name(slide_type)}.jpg")
+
+    return {
+        'type': slide_type,
+        'title': title,
+        'content': content,
+        'background_path': bg_path
+    }
@@ -0,0 +1,223 @@
+"""
+Typed model of a service order and its serialisations.
+
+ServiceOrder and ServiceItem hold what word_to_yaml.py parses out of a
+bulletin and write it out as YAML (through PyYAML's emitter, so titles
+with colons, quotes or '#' are quoted properly), JSON, or a compact
+pickled cache. load_service_data() is the reading side: simple_convert.py
+takes a service order from the binary cache while it still matches the
+YAML file and only parses the YAML again after it has changed.
+
+    order = ServiceOrder.from_parsed(service_date, theme, speaker, items)
+    order.save("service_orders/2025-06-22.yaml")   # YAML + warm cache
+    data = load_service_data("service_orders/2025-06-22.yaml")
+"""
+
+import json
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+from datetime import date
+
+import yaml
+
+from src.tools.service_parser import identify_slide_type
+
+# libyaml's C parser and emitter when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+SERVICE_CACHE_DIR = os.path.join("output", "service_cache")
+# Bump when the cached payload changes shape so old caches are ignored
+SERVICE_CACHE_VERSION = 1
+
+# Never fold long lines (prayers are single long paragraphs)
+YAML_LINE_WIDTH = 1 << 30
+
+ITEM_FIELDS = ("type", "title", "presenter", "speaker", "reference", "content")
+ORDER_FIELDS = ("date", "theme", "speaker", "order")
+
+
+class _ServiceDumper(SafeDumper):
+    """Writes multi-line text as a literal block, like a hand-written order"""
+
+
+def _represent_str(dumper, value):
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_ServiceDumper.add_representer(str, _represent_str)
+
+
+@dataclass(slots=True)
+class ServiceItem:
+    """One entry of the order of service"""
+
+    type: str
+    title: str
+    content: str = ""
+    presenter: str | None = None
+    speaker: str | None = None
+    reference: str | None = None
+    extra: dict = field(default_factory=dict)  # any other keys, kept as they are
+
+    @classmethod
+    def from_parsed(cls, item):
+        """From a service_parser item: {'title', 'content', 'metadata'}"""
+        title = item['title']
+        content = item['content']
+        metadata = item['metadata']
+        slide_type = identify_slide_type(title, content)
+
+        reference = None
+        if slide_type == 'scripture':
+            ref_match = re.search(r':\s*(.+)$', title)
+            if ref_match:
+                reference = ref_match.group(1)
+
+        speaker = None if 'presenter' in metadata else metadata.get('speaker')
+        return cls(slide_type, title, content, metadata.get('presenter'), speaker, reference)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data.get('type', 'text'),
+            data.get('title', ''),
+            data.get('content') or '',
+            data.get('presenter'),
+            data.get('speaker'),
+            data.get('reference'),
+            {key: value for key, value in data.items() if key not in ITEM_FIELDS},
+        )
+
+    def to_dict(self):
+        data = {'type': self.type, 'title': self.title}
+        for name in ('presenter', 'speaker', 'reference'):
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        if self.content:
+            data['content'] = self.content
+        data.update(self.extra)
+        return data
+
+
+@dataclass(slots=True)
+class ServiceOrder:
+    """A whole service: header fields plus the ordered items"""
+
+    date: date | str
+    theme: str = "Sunday Service"
+    speaker: str = ""
+    items: list = field(default_factory=list)
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_parsed(cls, service_date, theme, speaker, items):
+        """From parse_service_date/parse_theme/parse_speaker and parsed items"""
+        try:
+            service_date = date.fromisoformat(service_date)
+        except (TypeError, ValueError):
+            pass
+        return cls(service_date, theme, speaker, [ServiceItem.from_parsed(item) for item in items])
+
+    @classmethod
+    def from_dict(cls, data):
+        order_items = data.get('order', data.get('service_order', [])) or []
+        return cls(
+            data.get('date', ''),
+            data.get('theme', 'Sunday Service'),
+            data.get('speaker') or '',
+            [ServiceItem.from_dict(item) for item in order_items if isinstance(item, dict)],
+            {key: value for key, value in data.items()
+             if key not in ORDER_FIELDS and key != 'service_order'},
+        )
+
+    @classmethod
+    def from_yaml(cls, text):
+        return cls.from_dict(yaml.load(text, Loader=SafeLoader) or {})
+
+    def to_dict(self):
+        """Plain data, exactly what yaml.safe_load gives back for to_yaml()"""
+        data = {'date': self.date, 'theme': self.theme}
+        if self.speaker:
+            data['speaker'] = self.speaker
+        data.update(self.extra)
+        data['order'] = [item.to_dict() for item in self.items]
+        return data
+
+    def to_yaml(self):
+        return yaml.dump(self.to_dict(), Dumper=_ServiceDumper, sort_keys=False,
+                         allow_unicode=True, width=YAML_LINE_WIDTH)
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False, default=str)
+
+    def to_binary(self, source_stamp=None):
+        """Cache payload; source_stamp ties it to the YAML file it mirrors"""
+        return _cache_payload(self.to_dict(), source_stamp)
+
+    def save(self, yaml_path):
+        """Write the YAML file atomically and warm its binary cache"""
+        _write_atomic(yaml_path, self.to_yaml().encode('utf-8'))
+        _write_atomic(service_cache_path(yaml_path), self.to_binary(_file_stamp(yaml_path)))
+        return yaml_path
+
+
+def _file_stamp(path):
+    """Cheap content stamp for a file: [mtime_ns, size], or None if missing"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.partial"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _cache_payload(data, source_stamp):
+    return pickle.dumps({'version': SERVICE_CACHE_VERSION, 'source': source_stamp, 'data': data},
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def service_cache_path(yaml_path):
+    """output/service_cache/<name>.pickle for service_orders/<name>.yaml"""
+    name = os.path.splitext(os.path.basename(yaml_path))[0]
+    return os.path.join(SERVICE_CACHE_DIR, f"{name}.pickle")
+
+
+def load_service_data(yaml_path):
+    """
+    The parsed contents of a service order YAML file (as yaml.safe_load
+    returns them), from the binary cache while it matches the file's
+    mtime and size, otherwise parsed and cached again. The cache only
+    holds pickles this module wrote under output/.
+    """
+    stamp = _file_stamp(yaml_path)
+    cache_path = service_cache_path(yaml_path)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('version') == SERVICE_CACHE_VERSION and cached.get('source') == stamp:
+            return cached['data']
+    except Exception:
+        pass
+
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    try:
+        _write_atomic(cache_path, _cache_payload(data, stamp))
+    except OSError:
+        # A read-only output folder just means no cache
+        pass
+    return data
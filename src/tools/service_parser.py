@@ -0,0 +1,272 @@
+"""
+Service order parsing engine shared by the Word and plain-text inputs.
+
+Turns the text of a church bulletin into service items: the date, theme
+and speaker from the preamble, then one item per header found after the
+"Order of Service" line. word_to_yaml.py feeds it Word documents (with
+header hints from their formatting), test_text_to_yaml.py plain text,
+and benchmarks/bench_parser.py a synthetic corpus.
+
+    for item in iter_service_items(open("bulletin.txt")):
+        print(item['title'], identify_slide_type(item['title'], item['content']))
+
+iter_service_items takes any iterable of lines and yields each item as
+soon as the next header closes it, so a long bulletin never has to be
+split up front.
+"""
+
+import re
+from datetime import datetime
+
+ORDER_OF_SERVICE = re.compile(r'Order of Service', re.IGNORECASE)
+
+def parse_service_date(text, fallback_to_today=True):
+    """
+    Extract service date from text. Without a parseable date, warn and use
+    today's date, or return None when fallback_to_today is False.
+    """
+    date_pattern = r'Service Date:\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})'
+    match = re.search(date_pattern, text, re.IGNORECASE)
+
+    if match:
+        date_str = match.group(1)
+        try:
+            date_obj = datetime.strptime(date_str, "%B %d, %Y")
+            return date_obj.strftime("%Y-%m-%d")
+        except:
+            pass
+
+    if not fallback_to_today:
+        return None
+    print("⚠️ Could not parse service date from document")
+    return datetime.now().strftime("%Y-%m-%d")
+
+def parse_theme(text):
+    """Extract theme from text"""
+    theme_pattern = r'Theme:\s*(.+?)(?:\n|Speaker:|~)'
+    match = re.search(theme_pattern, text, re.IGNORECASE)
+
+    if match:
+        return match.group(1).strip()
+
+    return "Sunday Service"
+
+def parse_speaker(text):
+    """Extract speaker from text"""
+    speaker_pattern = r'Speaker:\s*(.+?)(?:\n|~)'
+    match = re.search(speaker_pattern, text, re.IGNORECASE)
+
+    if match:
+        return match.group(1).strip()
+
+    return ""
+
+def identify_slide_type(title, content):
+    """Determine slide type based on title and content"""
+    title_lower = title.lower()
+
+    if 'countdown' in title_lower:
+        return 'countdown'
+    elif 'communion' in title_lower or 'holy communion' in title_lower:
+        return 'communion'
+    elif 'offering' in title_lower:
+        return 'offering'
+    elif 'dismissal' in title_lower or 'benediction' in title_lower:
+        return 'dismissal'
+    elif "children's message" in title_lower or 'children message' in title_lower:
+        return 'children_message'
+    elif 'sermon' in title_lower or 'message' in title_lower:
+        return 'sermon'
+    elif 'scripture' in title_lower or 'reading' in title_lower:
+        return 'scripture'
+    elif 'hymn' in title_lower or (title_lower.startswith('#') or '#' in title):
+        return 'hymn'
+    elif 'praise' in title_lower or 'song' in title_lower or 'worship' in title_lower:
+        return 'song'
+    elif 'prayer' in title_lower:
+        return 'prayer'
+    elif 'call to worship' in title_lower or 'responsive' in title_lower:
+        return 'liturgy'
+    elif 'announcement' in title_lower:
+        return 'text'
+    else:
+        if content and ('L:' in content or 'P:' in content or 'Leader:' in content):
+            return 'liturgy'
+        return 'text'
+
+# Titles that always start a new item, matched anywhere in the line
+# ("X Minute Countdown" and "Scripture: <ref>" are covered by these too)
+KNOWN_HEADERS = [
+    'countdown', 'opening praise', 'closing praise', 'announcements',
+    "children's message", 'children message', 'call to worship',
+    'opening prayer', 'closing prayer', 'hymn of praise', 'scripture',
+    'sermon', 'message', 'holy communion', 'communion', "lord's prayer",
+    'prayers for the community', 'offering', 'doxology', 'dismissal',
+    'benediction', 'responsive reading', 'liturgy'
+]
+
+def _trie_pattern(words):
+    """
+    Regex for "any of these words", laid out as a prefix trie so the regex
+    engine walks each position once instead of trying every word in turn.
+    Word's curly apostrophe matches the straight one.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = []
+        for char, child in sorted(node.items()):
+            if char:
+                token = "['’]" if char == "'" else re.escape(char)
+                branches.append(token + build(child))
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A word ends here but longer ones continue
+            pattern = f'(?:{pattern})?'
+        return pattern
+
+    return build(trie)
+
+# All known titles compiled once; matched against the lower-cased line
+KNOWN_HEADER_PATTERN = re.compile(_trie_pattern(KNOWN_HEADERS))
+
+# Lines that read as item content rather than a title
+CONTENT_START = re.compile(r'-|L:|P:|#')
+SEPARATOR_LINE = re.compile(r'^[~=\-]{3,}$')
+
+def is_likely_header(line, next_line, formatted_header=None):
+    """
+    Determine if a line is likely a header for a service item.
+    More aggressive detection to ensure each item gets its own slide.
+
+    next_line is the line that follows ("" if blank, None at the end of
+    the order). formatted_header is what the document's formatting says
+    (heading style or bold), when known; it replaces the guess for short
+    capitalized lines.
+    """
+    line = line.strip()
+
+    if not line:
+        return False
+
+    # Definite headers: one scan of the line for any known title
+    if KNOWN_HEADER_PATTERN.search(line.lower()):
+        return True
+
+    # Pattern: Short line ending with colon (max 50 chars)
+    if line.endswith(':') and len(line) < 50:
+        return True
+
+    # Pattern: Single capitalized line that's not too long
+    # AND is followed by content (not another header)
+    if not ('A' <= line[0] <= 'Z' and len(line) < 40 and ':' not in line):
+        return False
+
+    # Formatting from the document beats guessing from the next line
+    if formatted_header is not None:
+        return formatted_header
+
+    # Check if next line looks like content: starts with -, L:, P:, #,
+    # or is long, or is empty
+    if next_line is not None:
+        next_line = next_line.strip()
+        if CONTENT_START.match(next_line) or len(next_line) > 60 or not next_line:
+            return True
+
+    return False
+
+def _order_lines(lines):
+    """
+    The lines after "Order of Service", each paired with the line that
+    follows it. Blank lines are dropped; a line followed by blanks gets ""
+    as its next line, and the last line gets None.
+    """
+    lines = iter(lines)
+    first = None
+    for line in lines:
+        match = ORDER_OF_SERVICE.search(line)
+        if match:
+            first = line[match.end():].strip()
+            break
+    if first is None:
+        print("⚠️ Could not find 'Order of Service' section")
+        return
+
+    previous = first or None
+    blank_after_previous = False
+    for line in lines:
+        line = line.rstrip()
+        if not line.strip():
+            blank_after_previous = previous is not None
+            continue
+        if previous is not None:
+            yield previous, "" if blank_after_previous else line
+        previous = line
+        blank_after_previous = False
+    if previous is not None:
+        yield previous, None
+
+def iter_service_items(lines, header_hints=None):
+    """
+    Yield the service items of a bulletin, one dict per header:
+    {'title': ..., 'content': ..., 'metadata': {'presenter': ...}}.
+
+    lines is any iterable of text lines (a list, an open file, ...).
+    header_hints ({line: bool}, e.g. from a Word document's formatting)
+    lets formatting decide ambiguous lines.
+    """
+    header_hints = header_hints or {}
+    current_title = None
+    current_content = []
+    current_metadata = {}
+
+    for line, next_line in _order_lines(lines):
+        stripped = line.strip()
+
+        # Skip separator lines
+        if SEPARATOR_LINE.match(stripped):
+            continue
+
+        # Check if this is a header
+        if is_likely_header(line, next_line, header_hints.get(stripped)):
+            # Emit the previous item
+            if current_title:
+                yield {
+                    'title': current_title,
+                    'content': '\n'.join(current_content).strip(),
+                    'metadata': current_metadata
+                }
+
+            # Start new item
+            current_title = line.rstrip(':').strip()
+            current_content = []
+            current_metadata = {}
+        elif stripped.startswith('-'):
+            # Presenter/speaker line
+            current_metadata['presenter'] = stripped.lstrip('-').strip()
+        else:
+            current_content.append(line)
+
+    # Don't forget the last item
+    if current_title:
+        yield {
+            'title': current_title,
+            'content': '\n'.join(current_content).strip(),
+            'metadata': current_metadata
+        }
+
+def parse_service_order(text, header_hints=None, verbose=True):
+    """Parse the order of service section of a bulletin into a list of items"""
+    items = []
+    for item in iter_service_items(text.split('\n'), header_hints):
+        items.append(item)
+        if verbose:
+            print(f"  📌 Parsed: {item['title']}")
+    return items
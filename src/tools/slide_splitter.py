@@ -0,0 +1,232 @@
+"""
+Deterministic slide splitter: breaks long slide content into
+"Title (Part N)" slides that fit the text box drawn by pptx_builder.py.
+
+Text is measured with real font metrics (Pillow) against the same box
+size and font sizes the builder uses, and is split on line, then
+sentence, then word boundaries. The text itself is never rewritten.
+
+    slides = split_slides(slides)
+"""
+
+import math
+import re
+from functools import lru_cache
+
+from PIL import ImageFont
+
+# Text box layout shared with pptx_builder.py (inches / points)
+CONTENT_WIDTH_IN = 9
+CONTENT_HEIGHT_IN = 5
+TEXT_MARGIN_IN = 0.3
+TEXT_INSET_X_IN = 0.1         # python-pptx default text frame insets
+TEXT_INSET_Y_IN = 0.05
+FIRST_PARAGRAPH_PT = 18       # the empty paragraph every new text box starts with
+TITLE_PT = 36
+SPACER_PT = 8
+CONTENT_PT = 24
+LINE_SPACING = 1.2            # single spacing, as a multiple of the font size
+
+# PowerPoint's default theme font is Calibri; the fallbacks are wider,
+# so measuring with them errs towards more, shorter slides
+REGULAR_FONTS = [
+    "calibri.ttf",
+    "/Library/Fonts/Microsoft/Calibri.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+]
+BOLD_FONTS = [
+    "calibrib.ttf",
+    "/Library/Fonts/Microsoft/Calibri Bold.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "arialbd.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+]
+
+# Rough average glyph width (in em) when no font file can be loaded
+FALLBACK_EM_WIDTH = 0.55
+
+SENTENCE_BREAK = re.compile(r'(?<=[.!?;:])\s+')
+
+
+@lru_cache(maxsize=None)
+def _load_font(size, bold=False):
+    for font_path in (BOLD_FONTS if bold else REGULAR_FONTS):
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            continue
+    return None
+
+
+def text_width(text, size, bold=False):
+    """Width of one line of text in points"""
+    font = _load_font(size, bold)
+    if font is None:
+        return len(text) * size * FALLBACK_EM_WIDTH
+    # Fonts are loaded at the point size, so one pixel is one point
+    return font.getlength(text)
+
+
+def wrap_text(text, size, width, bold=False):
+    """Greedy word wrap, as PowerPoint does it; returns the visual lines"""
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and text_width(candidate, size, bold) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines or [""]
+
+
+def text_area():
+    """(width, height) in points available inside the builder's text box"""
+    width = (CONTENT_WIDTH_IN - 2 * TEXT_MARGIN_IN - 2 * TEXT_INSET_X_IN) * 72
+    height = (CONTENT_HEIGHT_IN - 2 * TEXT_MARGIN_IN - 2 * TEXT_INSET_Y_IN) * 72
+    return width, height
+
+
+def content_capacity(title):
+    """How many wrapped content lines fit under a title"""
+    width, height = text_area()
+    title_lines = len(wrap_text(str(title), TITLE_PT, width, bold=True))
+    used = (FIRST_PARAGRAPH_PT + title_lines * TITLE_PT + SPACER_PT) * LINE_SPACING
+    return max(1, int((height - used) // (CONTENT_PT * LINE_SPACING)))
+
+
+def _chunks(content, width, capacity):
+    """
+    Break content into (text, wrapped height, paragraph) units that each fit
+    on one slide: whole lines where possible, else sentences, else words.
+    """
+    chunks = []
+    lines = [line.strip() for line in str(content).split("\n")]
+    # Blank lines are dropped by the builder, so they are dropped here too
+    for paragraph, line in enumerate(line for line in lines if line):
+        height = len(wrap_text(line, CONTENT_PT, width))
+        if height <= capacity:
+            chunks.append((line, height, paragraph))
+            continue
+
+        pieces = []
+        for sentence in SENTENCE_BREAK.split(line):
+            wrapped = wrap_text(sentence, CONTENT_PT, width)
+            # One enormous sentence: fall back to slide-sized runs of words
+            for i in range(0, len(wrapped), capacity):
+                pieces.append(" ".join(wrapped[i:i + capacity]))
+        for piece in pieces:
+            chunks.append((piece, len(wrap_text(piece, CONTENT_PT, width)), paragraph))
+    return chunks
+
+
+def _pack(chunks, capacity, width):
+    """
+    Greedily fill pages of at most `capacity` wrapped lines. Sentences of
+    one paragraph share a line on the slide, so they are measured together.
+    """
+    pages = []
+    current, used = [], 0          # used: lines of the finished paragraphs
+    paragraph_text, paragraph = "", None
+    for text, height, chunk_paragraph in chunks:
+        if chunk_paragraph == paragraph:
+            joined = f"{paragraph_text} {text}"
+            if used + len(wrap_text(joined, CONTENT_PT, width)) <= capacity:
+                current.append((text, height, chunk_paragraph))
+                paragraph_text = joined
+                continue
+        elif paragraph is not None:
+            used += len(wrap_text(paragraph_text, CONTENT_PT, width))
+            if used + height <= capacity:
+                current.append((text, height, chunk_paragraph))
+                paragraph_text, paragraph = text, chunk_paragraph
+                continue
+
+        if current:
+            pages.append(current)
+        current, used = [(text, height, chunk_paragraph)], 0
+        paragraph_text, paragraph = text, chunk_paragraph
+    if current:
+        pages.append(current)
+    return pages
+
+
+def _page_text(page):
+    """Join a page's chunks, keeping sentences of one paragraph on one line"""
+    lines = []
+    previous = None
+    for text, _, paragraph in page:
+        if paragraph == previous:
+            lines[-1] += " " + text
+        else:
+            lines.append(text)
+        previous = paragraph
+    return "\n".join(lines)
+
+
+def _page_height(page, width):
+    """Wrapped lines a page takes up on the slide"""
+    return sum(len(wrap_text(line, CONTENT_PT, width)) for line in _page_text(page).split("\n"))
+
+
+def split_content(title, content):
+    """
+    Split content into pages that fit one slide each. Pages are balanced
+    (9 lines become 5 + 4 rather than 8 + 1). Content that already fits is
+    returned unchanged. Returns a list of strings.
+    """
+    width, _ = text_area()
+    content = str(content or "")
+    chunks = _chunks(content, width, content_capacity(title))
+    if len(_pack(chunks, content_capacity(title), width)) <= 1:
+        return [content]
+
+    # Split slides carry a "(Part N)" suffix, which may wrap the title
+    capacity = content_capacity(f"{title} (Part 9)")
+    chunks = _chunks(content, width, capacity)
+    pages = _pack(chunks, capacity, width)
+    total = sum(_page_height(page, width) for page in pages)
+    for target in range(math.ceil(total / len(pages)), capacity):
+        balanced = _pack(chunks, target, width)
+        if len(balanced) == len(pages):
+            pages = balanced
+            break
+    return [_page_text(page) for page in pages]
+
+
+def split_slide(slide):
+    """One slide dict in, one or more slide dicts out"""
+    content = slide.get("content", "")
+    if not content:
+        return [slide]
+
+    title = slide.get("title", "")
+    pages = split_content(title, content)
+    if len(pages) == 1:
+        return [slide]
+
+    parts = []
+    for number, page in enumerate(pages, start=1):
+        part = dict(slide)
+        part["title"] = f"{title} (Part {number})" if title else f"Part {number}"
+        part["content"] = page
+        if number > 1:
+            part.pop("countdown_video", None)
+        parts.append(part)
+    return parts
+
+
+def split_slides(slides):
+    """Split every slide whose content doesn't fit its text box"""
+    result = []
+    for slide in slides:
+        if isinstance(slide, dict):
+            result.extend(split_slide(slide))
+        else:
+            result.append(slide)
+    return result
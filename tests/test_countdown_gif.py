@@ -0,0 +1,38 @@
+"""Header checks for the streamed countdown GIF"""
+
+import os
+import sys
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from create_countdown import create_countdown_gif
+
+
+def _render(tmp_path, workers):
+    output_path = str(tmp_path / f"countdown_{workers}.gif")
+    assert create_countdown_gif(duration=2, output_path=output_path,
+                                theme_path=str(tmp_path / "missing.jpg"), workers=workers)
+    return output_path
+
+
+def test_gif_header_is_gif89a_and_loops(tmp_path):
+    output_path = _render(tmp_path, workers=1)
+    with open(output_path, 'rb') as f:
+        data = f.read()
+    assert data[:6] == b"GIF89a"
+    assert b"NETSCAPE2.0" in data
+    assert data.endswith(b";")
+
+    with Image.open(output_path) as gif:
+        assert gif.n_frames == 3
+        assert gif.info['loop'] == 0
+        assert gif.info['duration'] == 1000
+
+
+def test_gif_with_workers_matches_single_process(tmp_path):
+    single = _render(tmp_path, workers=1)
+    pooled = _render(tmp_path, workers=2)
+    with open(single, 'rb') as a, open(pooled, 'rb') as b:
+        assert a.read() == b.read()
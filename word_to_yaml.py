@@ -2,280 +2,179 @@
 """
 Convert a Word document service order to YAML format for church slides.
 Usage: python word_to_yaml.py <input.docx>
+       python word_to_yaml.py --batch <folder or glob> [--build] [--workers N]
 """
 
 import sys
 import os
-import re
-from datetime import datetime
-import mammoth
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from src.tools.docx_reader import iter_paragraphs
+from src.tools.service_parser import (
+    parse_service_date, parse_theme, parse_speaker,
+    parse_service_order,
+)
+from src.tools.service_model import ServiceOrder
 
-def extract_text_from_docx(docx_path):
-    """Extract text from Word document"""
+def read_docx(docx_path, exit_on_error=True):
+    """
+    Stream a Word document's paragraphs into plain text (one paragraph per
+    line) plus header hints from their formatting: {line: True} for
+    heading-style or short bold lines, {line: False} for plain ones.
+    With exit_on_error=False an unreadable document raises instead.
+    """
+    lines = []
+    header_hints = {}
     try:
-        with open(docx_path, "rb") as docx_file:
-            result = mammoth.extract_raw_text(docx_file)
-            return result.value
+        for paragraph in iter_paragraphs(docx_path):
+            formatted_header = paragraph.looks_like_header
+            for line in paragraph.text.replace('\xa0', ' ').split('\n'):
+                lines.append(line)
+                if line.strip():
+                    key = line.strip()
+                    header_hints[key] = header_hints.get(key, False) or formatted_header
     except Exception as e:
+        if not exit_on_error:
+            raise
         print(f"❌ Error reading Word document: {e}")
         sys.exit(1)
+    return '\n'.join(lines), header_hints
 
-def parse_service_date(text):
-    """Extract service date from text"""
-    date_pattern = r'Service Date:\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})'
-    match = re.search(date_pattern, text, re.IGNORECASE)
-    
-    if match:
-        date_str = match.group(1)
-        try:
-            date_obj = datetime.strptime(date_str, "%B %d, %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        except:
-            pass
-    
-    print("⚠️ Could not parse service date from document")
-    return datetime.now().strftime("%Y-%m-%d")
-
-def parse_theme(text):
-    """Extract theme from text"""
-    theme_pattern = r'Theme:\s*(.+?)(?:\n|Speaker:|~)'
-    match = re.search(theme_pattern, text, re.IGNORECASE)
-    
-    if match:
-        return match.group(1).strip()
-    
-    return "Sunday Service"
+def extract_text_from_docx(docx_path):
+    """Extract text from Word document"""
+    return read_docx(docx_path)[0]
 
-def parse_speaker(text):
-    """Extract speaker from text"""
-    speaker_pattern = r'Speaker:\s*(.+?)(?:\n|~)'
-    match = re.search(speaker_pattern, text, re.IGNORECASE)
-    
-    if match:
-        return match.group(1).strip()
-    
-    return ""
+def convert_docx(docx_path):
+    """
+    Parse one Word document without printing per-item progress.
+    Returns a result dict (docx, service_date, theme, items, order) or one
+    with an 'error' key. Runs in batch worker processes.
+    """
+    result = {'docx': docx_path}
+    start = time.perf_counter()
+    try:
+        text, header_hints = read_docx(docx_path, exit_on_error=False)
+        result['service_date'] = parse_service_date(text, fallback_to_today=False)
+        if result['service_date'] is None:
+            # Never fall back to today's date here: it would overwrite
+            # today's real order, and every undated file would collide
+            raise ValueError("no parseable 'Service Date:', not written")
+        result['theme'] = parse_theme(text)
+        speaker = parse_speaker(text)
+        items = parse_service_order(text, header_hints, verbose=False)
+        result['items'] = len(items)
+        result['order'] = ServiceOrder.from_parsed(result['service_date'], result['theme'], speaker, items)
+    except Exception as e:
+        result['error'] = str(e) or type(e).__name__
+    result['seconds'] = time.perf_counter() - start
+    return result
 
-def identify_slide_type(title, content):
-    """Determine slide type based on title and content"""
-    title_lower = title.lower()
-    
-    if 'countdown' in title_lower:
-        return 'countdown'
-    elif 'communion' in title_lower or 'holy communion' in title_lower:
-        return 'communion'
-    elif 'offering' in title_lower:
-        return 'offering'
-    elif 'dismissal' in title_lower or 'benediction' in title_lower:
-        return 'dismissal'
-    elif "children's message" in title_lower or 'children message' in title_lower:
-        return 'children_message'
-    elif 'sermon' in title_lower or 'message' in title_lower:
-        return 'sermon'
-    elif 'scripture' in title_lower or 'reading' in title_lower:
-        return 'scripture'
-    elif 'hymn' in title_lower or (title_lower.startswith('#') or '#' in title):
-        return 'hymn'
-    elif 'praise' in title_lower or 'song' in title_lower or 'worship' in title_lower:
-        return 'song'
-    elif 'prayer' in title_lower:
-        return 'prayer'
-    elif 'call to worship' in title_lower or 'responsive' in title_lower:
-        return 'liturgy'
-    elif 'announcement' in title_lower:
-        return 'text'
+def find_docx_files(source):
+    """A folder (every .docx in it) or a glob pattern, sorted"""
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "*.docx")
     else:
-        if content and ('L:' in content or 'P:' in content or 'Leader:' in content):
-            return 'liturgy'
-        return 'text'
+        pattern = source
+    # Skip Word's "~$name.docx" lock files
+    return sorted(path for path in glob.glob(pattern)
+                  if path.lower().endswith(".docx") and not os.path.basename(path).startswith("~$"))
 
-def is_likely_header(line, next_lines):
+def batch_word_to_yaml(source, build=False, workers=None, output_dir="service_orders"):
     """
-    Determine if a line is likely a header for a service item.
-    More aggressive detection to ensure each item gets its own slide.
+    Convert every .docx matched by source without prompting: parse in
+    parallel, write <output_dir>/<date>.yaml atomically, print a summary,
+    and optionally build the decks in this process (simple_convert's batch
+    mode, which reads service_orders/, so build needs the default
+    output_dir). Returns the list of per-file results.
     """
-    line = line.strip()
-    
-    if not line:
-        return False
-    
-    # Definite headers
-    known_headers = [
-        'countdown', 'opening praise', 'closing praise', 'announcements',
-        "children's message", 'children message', 'call to worship',
-        'opening prayer', 'closing prayer', 'hymn of praise', 'scripture',
-        'sermon', 'message', 'holy communion', 'communion', "lord's prayer",
-        'prayers for the community', 'offering', 'doxology', 'dismissal',
-        'benediction', 'responsive reading', 'liturgy'
-    ]
-    
-    line_lower = line.lower().rstrip(':')
-    
-    # Check against known headers
-    for header in known_headers:
-        if header in line_lower:
-            return True
-    
-    # Pattern: "X Minute Countdown"
-    if re.match(r'^\d+\s+Minute\s+Countdown', line, re.IGNORECASE):
-        return True
-    
-    # Pattern: Short line ending with colon (max 50 chars)
-    if line.endswith(':') and len(line) < 50:
-        return True
-    
-    # Pattern: "Scripture: Reference"
-    if re.match(r'^Scripture:\s*.+', line, re.IGNORECASE):
-        return True
-    
-    # Pattern: Single capitalized line that's not too long
-    # AND is followed by content (not another header)
-    if (re.match(r'^[A-Z]', line) and 
-        len(line) < 40 and 
-        ':' not in line and
-        not line.startswith('-')):
-        
-        # Check if next line looks like content
-        if next_lines:
-            next_line = next_lines[0].strip()
-            # Content indicators: starts with -, L:, P:, #, or is long, or is empty
-            if (next_line.startswith('-') or 
-                next_line.startswith('L:') or 
-                next_line.startswith('P:') or
-                next_line.startswith('#') or
-                len(next_line) > 60 or
-                not next_line):
-                return True
-    
-    return False
-
-def parse_service_order(text):
-    """Parse the order of service section with improved header detection"""
-    # Find the "Order of Service" section
-    order_start = re.search(r'Order of Service', text, re.IGNORECASE)
-    if not order_start:
-        print("⚠️ Could not find 'Order of Service' section")
+    if build:
+        from simple_convert import SERVICE_ORDERS_DIR
+        if os.path.abspath(output_dir) != os.path.abspath(SERVICE_ORDERS_DIR):
+            print(f"❌ --build reads {SERVICE_ORDERS_DIR}/, so it can't build YAML written to {output_dir}")
+            return []
+    
+    docx_files = find_docx_files(source)
+    if not docx_files:
+        print(f"❌ No .docx files found for: {source}")
         return []
     
-    service_text = text[order_start.end():].strip()
-    lines = [l.rstrip() for l in service_text.split('\n')]
+    start = time.perf_counter()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(docx_files)))
+    print(f"📚 Parsing {len(docx_files)} Word documents with {workers} worker(s)...")
     
-    items = []
-    current_title = None
-    current_content = []
-    current_metadata = {}
+    if workers == 1:
+        results = [convert_docx(path) for path in docx_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(convert_docx, docx_files))
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Get next few lines for lookahead
-        next_lines = lines[i+1:i+4] if i+1 < len(lines) else []
-        
-        # Skip separator lines
-        if re.match(r'^[~=\-]{3,}$', line.strip()):
-            i += 1
+    # Write in the parent so two bulletins for the same date can't race
+    written = {}
+    for result in results:
+        if 'error' in result:
             continue
-        
-        # Empty line - might separate items
-        if not line.strip():
-            i += 1
+        service_date = result['service_date']
+        if service_date in written:
+            result['error'] = f"same date as {written[service_date]}, not written"
             continue
-        
-        # Check if this is a header
-        if is_likely_header(line, next_lines):
-            # Save previous item if exists
-            if current_title:
-                content_str = '\n'.join(current_content).strip()
-                items.append({
-                    'title': current_title,
-                    'content': content_str,
-                    'metadata': current_metadata
-                })
-                print(f"  📌 Parsed: {current_title}")
-            
-            # Start new item
-            current_title = line.rstrip(':').strip()
-            current_content = []
-            current_metadata = {}
+        output_path = os.path.join(output_dir, f"{service_date}.yaml")
+        try:
+            result.pop('order').save(output_path)
+        except Exception as e:
+            result['error'] = f"could not write {output_path}: {e}"
+            continue
+        result['output'] = output_path
+        written[service_date] = result['docx']
+    
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 Word → YAML summary")
+    print("=" * 70)
+    for result in results:
+        name = os.path.basename(result['docx'])
+        if 'error' in result:
+            print(f"  ❌ {name:<40} {result['error']}")
         else:
-            # This is content
-            stripped = line.strip()
-            
-            # Check for presenter/speaker lines (start with -)
-            if stripped.startswith('-'):
-                presenter = stripped.lstrip('-').strip()
-                current_metadata['presenter'] = presenter
-            elif stripped:  # Not empty
-                current_content.append(line)
-        
-        i += 1
-    
-    # Don't forget the last item
-    if current_title:
-        content_str = '\n'.join(current_content).strip()
-        items.append({
-            'title': current_title,
-            'content': content_str,
-            'metadata': current_metadata
-        })
-        print(f"  📌 Parsed: {current_title}")
-    
-    return items
-
-def create_yaml_structure(service_date, theme, speaker, items):
-    """Create the YAML structure"""
-    yaml_lines = []
-    yaml_lines.append(f"date: {service_date}")
-    yaml_lines.append(f"theme: {theme}")
-    if speaker:
-        yaml_lines.append(f"speaker: {speaker}")
-    yaml_lines.append("")
-    yaml_lines.append("order:")
-    
-    for item in items:
-        title = item['title']
-        content = item['content']
-        metadata = item['metadata']
-        
-        # Determine slide type
-        slide_type = identify_slide_type(title, content)
-        
-        yaml_lines.append(f"  - type: {slide_type}")
-        yaml_lines.append(f"    title: {title}")
-        
-        # Add presenter/speaker if present
-        if 'presenter' in metadata:
-            yaml_lines.append(f"    presenter: {metadata['presenter']}")
-        elif 'speaker' in metadata:
-            yaml_lines.append(f"    speaker: {metadata['speaker']}")
-        
-        # Handle scripture references
-        if slide_type == 'scripture':
-            ref_match = re.search(r':\s*(.+)$', title)
-            if ref_match:
-                yaml_lines.append(f"    reference: {ref_match.group(1)}")
-        
-        # Add content if present
-        if content:
-            if '\n' in content or len(content) > 60:
-                # Multi-line content
-                yaml_lines.append("    content: |")
-                for line in content.split('\n'):
-                    yaml_lines.append(f"      {line}")
-            else:
-                # Single line content
-                yaml_lines.append(f'    content: "{content}"')
-    
-    return '\n'.join(yaml_lines)
+            print(f"  ✅ {name:<40} {result['service_date']}  {result['items']:>3} items  "
+                  f"({result['seconds']*1000:.0f}ms)")
+    failed = sum(1 for result in results if 'error' in result)
+    print("=" * 70)
+    print(f"  {len(results) - failed} converted, {failed} failed in {elapsed:.1f}s")
+    
+    if build and written:
+        print()
+        from simple_convert import batch_convert
+        decks = batch_convert(sorted(written), workers=workers)
+        for result in results:
+            if 'output' in result and not decks.get(result['service_date']):
+                result['error'] = "deck build failed"
+    
+    return results
 
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Convert Word service orders to YAML")
+    parser.add_argument('docx', nargs='?', help='Word document to convert')
+    parser.add_argument('--batch', metavar='SOURCE',
+                        help='Convert every .docx in a folder or matching a glob, without prompting')
+    parser.add_argument('--build', action='store_true',
+                        help='Batch: also build the PowerPoint decks (in this process)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Batch: worker processes (default: one per CPU)')
+    args = parser.parse_args()
+    
+    if args.batch:
+        results = batch_word_to_yaml(args.batch, build=args.build, workers=args.workers)
+        sys.exit(0 if results and all('error' not in result for result in results) else 1)
+    
+    if not args.docx:
         print("Usage: python word_to_yaml.py <input.docx>")
         print("\nOr run interactively:")
         docx_path = input("Enter path to Word document: ").strip()
     else:
-        docx_path = sys.argv[1]
+        docx_path = args.docx
     
     if not os.path.exists(docx_path):
         print(f"❌ File not found: {docx_path}")
@@ -283,8 +182,8 @@ def main():
     
     print(f"📄 Reading {docx_path}...")
     
-    # Extract text from Word document
-    text = extract_text_from_docx(docx_path)
+    # Extract text (and formatting hints) from Word document
+    text, header_hints = read_docx(docx_path)
     
     # Parse the document
     print("🔍 Parsing document...")
@@ -293,7 +192,7 @@ def main():
     speaker = parse_speaker(text)
     
     print("\n📋 Extracting service items:")
-    items = parse_service_order(text)
+    items = parse_service_order(text, header_hints)
     
     print(f"\n📅 Service Date: {service_date}")
     print(f"🎨 Theme: {theme}")
@@ -302,14 +201,12 @@ def main():
     print(f"✅ Found {len(items)} service items")
     
     # Create YAML
-    yaml_content = create_yaml_structure(service_date, theme, speaker, items)
+    order = ServiceOrder.from_parsed(service_date, theme, speaker, items)
+    yaml_content = order.to_yaml()
     
-    # Save to file
+    # Save to file (and warm simple_convert's binary cache)
     output_filename = f"service_orders/{service_date}.yaml"
-    os.makedirs("service_orders", exist_ok=True)
-    
-    with open(output_filename, 'w') as f:
-        f.write(yaml_content)
+    order.save(output_filename)
     
     print(f"\n✅ Created: {output_filename}")
     print("\n📝 Preview:")